@@ -3,7 +3,10 @@
 Download the full Jeopardy dataset from Hugging Face.
 
 This script downloads the jeopardy-datasets/jeopardy dataset and
-saves it as JSON for use in the project.
+saves it as a Parquet file for use in the project. Parquet stores each
+column together (compressed, with repeated categories dictionary-encoded),
+so the file is a fraction of the size of JSON and much faster to read back.
+Pass a .jsonl output path to get JSON Lines (one clue per line) instead.
 
 Run with: uv run python scripts/download_data.py
 
@@ -16,13 +19,41 @@ The dataset contains ~216K questions with fields:
 - show_number: str
 - air_date: str
 
-Requires: uv add datasets
+Requires: uv add datasets  (which also installs pyarrow)
 """
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import json
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Columns kept from the raw dataset, in output order
+CLUE_COLUMNS = [
+    "category",
+    "value",
+    "question",
+    "answer",
+    "round",
+    "show_number",
+    "air_date",
+]
+
+# Rows per batch when streaming the dataset into Parquet
+BATCH_SIZE = 10_000
+
+
+def dump_json_line(obj: dict) -> bytes:
+    """Serialize one record as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode() + b"\n"
+
 
 def parse_value(value_str: str | None) -> int | None:
     """
@@ -53,12 +84,111 @@ def parse_value(value_str: str | None) -> int | None:
         return None
 
 
+def iter_clues(rows) -> Iterator[dict]:
+    """Convert raw dataset rows into clue dictionaries with integer values."""
+    for item in rows:
+        yield {
+            "category": item.get("category", ""),
+            "value": parse_value(item.get("value")),
+            "question": item.get("question", ""),
+            "answer": item.get("answer", ""),
+            "round": item.get("round", ""),
+            "show_number": item.get("show_number"),
+            "air_date": item.get("air_date", ""),
+        }
+
+
+def write_jsonl(clues: Iterable[dict], output_path: Path) -> int:
+    """Write clues one per line, so only one clue is in memory at a time."""
+    count = 0
+    with open(output_path, "wb") as f:
+        for clue in clues:
+            f.write(dump_json_line(clue))
+            count += 1
+    return count
+
+
+def parse_value_column(values):
+    """
+    Vectorized parse_value for a whole pyarrow string column.
+
+    Strips "$" and "," and casts to int32 in a few Arrow compute kernels,
+    instead of calling parse_value once per row in Python. Anything that
+    isn't a plain integer afterwards becomes null, matching parse_value.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    t = values.type
+    if not (pa.types.is_string(t) or pa.types.is_large_string(t)):
+        return values.cast(pa.int32())
+    digits = pc.replace_substring_regex(values, r"[$,]", "")
+    is_number = pc.match_substring_regex(digits, r"^-?\d+$")
+    digits = pc.if_else(is_number, digits, pa.scalar(None, digits.type))
+    return pc.cast(digits, pa.int32())
+
+
+def clues_table(raw):
+    """Select the clue columns from the raw dataset table and parse values."""
+    import pyarrow as pa
+
+    # A batch can lack a field entirely; fill it with nulls, as iter_clues
+    # falls back to defaults rather than failing
+    for name in CLUE_COLUMNS:
+        if name not in raw.column_names:
+            raw = raw.append_column(name, pa.nulls(raw.num_rows, pa.string()))
+    table = raw.select(CLUE_COLUMNS)
+    value_index = table.schema.get_field_index("value")
+    return table.set_column(value_index, "value", parse_value_column(table["value"]))
+
+
+def iter_clue_tables(rows, batch_size: int = BATCH_SIZE) -> Iterator:
+    """Group streamed dataset rows into clue tables of batch_size rows."""
+    import pyarrow as pa
+
+    for batch in rows.iter(batch_size=batch_size):
+        yield clues_table(pa.Table.from_pydict(batch))
+
+
+def write_parquet(tables: Iterable, output_path: Path) -> int:
+    """
+    Write clue tables to one ZSTD-compressed Parquet file as they arrive.
+
+    Each table becomes its own row group, so only one batch is ever held
+    in memory.
+    """
+    import pyarrow.parquet as pq
+
+    count = 0
+    writer = None
+    try:
+        for table in tables:
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    output_path,
+                    table.schema,
+                    compression="zstd",
+                    use_dictionary=["category", "round"],
+                )
+            # Later batches can infer slightly different types (e.g. an
+            # all-null column), so match the schema of the first one
+            writer.write_table(table.cast(writer.schema))
+            count += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
 def download_jeopardy_data(output_path: Path) -> int:
     """
-    Download Jeopardy data from Hugging Face and save as JSON.
+    Download Jeopardy data from Hugging Face and save it to disk.
+
+    The format is picked from the file suffix: ".jsonl" writes JSON Lines,
+    anything else writes Parquet (with a .parquet suffix).
 
     Args:
-        output_path: Where to save the JSON file
+        output_path: Where to save the data
 
     Returns:
         Number of questions downloaded
@@ -74,37 +204,27 @@ def download_jeopardy_data(output_path: Path) -> int:
     print("Downloading dataset from Hugging Face...")
     print("(This may take a minute on first run)")
 
-    # Load the dataset
-    ds = load_dataset("jeopardy-datasets/jeopardy")
-
-    # Convert to list of dicts
-    clues = []
-    for item in ds["train"]:
-        clue = {
-            "category": item.get("category", ""),
-            "value": parse_value(item.get("value")),
-            "question": item.get("question", ""),
-            "answer": item.get("answer", ""),
-            "round": item.get("round", ""),
-            "show_number": item.get("show_number"),
-            "air_date": item.get("air_date", ""),
-        }
-        clues.append(clue)
+    # Stream the dataset: rows are written as they download instead of
+    # materializing the whole dataset first, so memory stays at one batch
+    ds = load_dataset("jeopardy-datasets/jeopardy", split="train", streaming=True)
 
-    # Save to JSON
-    print(f"Writing {len(clues):,} clues to {output_path}...")
+    if output_path.suffix != ".jsonl":
+        output_path = output_path.with_suffix(".parquet")
+    print(f"Writing clues to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(clues, f, indent=2)
+    if output_path.suffix == ".jsonl":
+        count = write_jsonl(iter_clues(ds), output_path)
+    else:
+        count = write_parquet(iter_clue_tables(ds), output_path)
 
     print("Done!")
-    return len(clues)
+    return count
 
 
 def main():
     """Main entry point."""
-    output_path = Path(__file__).parent.parent / "data" / "jeopardy_full.json"
+    output_path = Path(__file__).parent.parent / "data" / "jeopardy_full.parquet"
 
     print("=" * 50)
     print("Jeopardy Dataset Downloader")
@@ -119,8 +239,8 @@ def main():
         print(f"Saved to: {output_path}")
         print()
         print("You can now load this data with:")
-        print("  from jeopardy.data import load_json_file")
-        print(f"  clues = load_json_file(Path('{output_path}'))")
+        print("  from jeopardy.data import load_parquet_file")
+        print(f"  clues = load_parquet_file(Path('{output_path}'))")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+"""
+Arrow-backed clue storage for fast game startup.
+
+This module handles:
+- Caching the cleaned clue table as an Arrow IPC (Feather) file
+- Memory-mapping that file back in without parsing anything
+- Board queries that mirror database.py, but filter Arrow columns
+
+Why a second storage format?
+- Opening a memory-mapped Arrow file is O(open the file), not O(rows):
+  the OS pages columns in on demand, so there's nothing to decode
+- The cleaned table is built once from the TSV and reused every game
+
+Importing this module requires pyarrow. Callers that want to keep
+pyarrow optional should catch ImportError and fall back to database.py.
+"""
+
+import random
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+from .data import TSV_DATA_PATH, clean_clue_table, load_tsv_table
+
+# Default cache location (next to jeopardy.db, in the working directory)
+CLUE_CACHE_PATH = Path("clues.arrow")
+
+
+def _value_set(column: pa.ChunkedArray, values: list) -> pa.Array:
+    """
+    values as an array pc.is_in() accepts for column.
+
+    Cached tables dictionary-encode their text columns (see
+    data.REPEATED_COLUMNS), and is_in wants the dictionary's value type.
+    """
+    value_type = column.type
+    if pa.types.is_dictionary(value_type):
+        value_type = value_type.value_type
+    return pa.array(values, value_type)
+
+
+def write_clue_cache(table: pa.Table, cache_path: Path = CLUE_CACHE_PATH) -> None:
+    """
+    Save a clue table as an uncompressed Arrow IPC file.
+
+    Uncompressed on purpose: compressed buffers would have to be
+    decompressed on every open, which defeats memory-mapping.
+    """
+    feather.write_feather(table, cache_path, compression="uncompressed")
+
+
+def open_clue_cache(cache_path: Path = CLUE_CACHE_PATH) -> pa.Table:
+    """
+    Memory-map a cached clue table (zero-copy).
+
+    Raises:
+        FileNotFoundError: If the cache file doesn't exist
+    """
+    source = pa.memory_map(str(cache_path))
+    return pa.ipc.open_file(source).read_all()
+
+
+def build_clue_cache(
+    cache_path: Path = CLUE_CACHE_PATH,
+    tsv_path: Path = TSV_DATA_PATH
+) -> pa.Table:
+    """
+    Load and clean the TSV, write it to the cache, and return the table.
+    """
+    table = clean_clue_table(load_tsv_table(tsv_path))
+    write_clue_cache(table, cache_path)
+    return table
+
+
+def get_usable_categories(
+    table: pa.Table,
+    min_clues_per_value: int = 1,
+    round_num: int = 1
+) -> list[str]:
+    """
+    Find categories that have at least min_clues_per_value at each value level.
+
+    Same result as database.get_usable_categories, computed with an
+    Arrow group-by instead of SQL.
+    """
+    if round_num == 1:
+        values = [200, 400, 600, 800, 1000]
+    else:
+        values = [400, 800, 1200, 1600, 2000]
+
+    mask = pc.and_(
+        pc.is_in(table["value"], value_set=_value_set(table["value"], values)),
+        pc.equal(table["round"], str(round_num)),
+    )
+    per_value = (
+        table.filter(mask)
+        .group_by(["category", "value"])
+        .aggregate([("value", "count")])
+    )
+    per_value = per_value.filter(
+        pc.greater_equal(per_value["value_count"], min_clues_per_value)
+    )
+    per_category = per_value.group_by("category").aggregate([("value", "count")])
+    complete = per_category.filter(pc.equal(per_category["value_count"], len(values)))
+    return complete["category"].to_pylist()
+
+
+def get_random_clue(
+    table: pa.Table,
+    category: str,
+    value: int,
+    round_num: int | None = None
+) -> dict | None:
+    """
+    Get a random clue from a category at a specific value.
+
+    Returns:
+        Clue dictionary or None if no matching clue exists
+    """
+    mask = pc.and_(
+        pc.equal(table["category"], category), pc.equal(table["value"], value)
+    )
+    if round_num is not None:
+        mask = pc.and_(mask, pc.equal(table["round"], str(round_num)))
+    matches = table.filter(mask)
+    if matches.num_rows == 0:
+        return None
+    return matches.slice(random.randrange(matches.num_rows), 1).to_pylist()[0]
+
+
+def get_board_clues(
+    table: pa.Table,
+    categories: list[str],
+    values: list[int],
+    round_num: int | None = None
+) -> dict[tuple[str, int], dict]:
+    """
+    Pick one random clue for every (category, value) cell.
+
+    Same result shape as database.get_board_clues: one filter over the
+    table for the whole board, then a random row per cell.
+    """
+    category_set = _value_set(table["category"], categories)
+    mask = pc.and_(
+        pc.is_in(table["category"], value_set=category_set),
+        pc.is_in(table["value"], value_set=_value_set(table["value"], values)),
+    )
+    if round_num is not None:
+        mask = pc.and_(mask, pc.equal(table["round"], str(round_num)))
+
+    candidates: dict[tuple[str, int], list[dict]] = {}
+    for clue in table.filter(mask).to_pylist():
+        candidates.setdefault((clue["category"], clue["value"]), []).append(clue)
+    return {cell: random.choice(clues) for cell, clues in candidates.items()}
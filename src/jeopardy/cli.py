@@ -19,12 +19,19 @@ a web UI (Streamlit) or other interface without changing the core game.
 
 import os
 import random
+import sys
 from pathlib import Path
 
-from .database import get_random_clue, get_usable_categories, create_database, load_clues_to_db
-from .data import clean_clues, load_tsv_data
 from .game import Board, STANDARD_VALUES, check_answer, calculate_score_change, generate_board
-from .state import GameState, create_new_game
+from .state import VALUE_BITS, GameState, create_new_game
+
+
+# ANSI escape: move cursor home, then erase the whole display
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Banner rules, built once instead of on every redraw
+BAR_SINGLE = "=" * 40
+BAR_DOUBLE = "═" * 40
 
 
 def clear_screen() -> None:
@@ -33,9 +40,15 @@ def clear_screen() -> None:
 
     Works on both Windows and Unix-like systems.
 
-    Hint: Use os.system('cls' or 'clear')
+    On Unix-like terminals we write the ANSI "home + erase display"
+    sequence directly instead of spawning a `clear` process every turn.
+    The classic Windows console doesn't understand it, so keep cls there.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
 
 
 def display_welcome() -> None:
@@ -44,14 +57,14 @@ def display_welcome() -> None:
 
     Called at the start of a new game.
     """
-    print("=" * 40)
+    print(BAR_SINGLE)
     print("      WELCOME TO JEOPARDY!")
-    print("=" * 40)
+    print(BAR_SINGLE)
     print()
 
 def display_board(
     categories: list[str],
-    answered: set[tuple[str, int]],
+    answered_mask: dict[str, int],
     values: list[int] = STANDARD_VALUES
 ) -> None:
     """
@@ -72,23 +85,24 @@ def display_board(
 
     Args:
         categories: List of 6 category names
-        answered: Set of (category, value) pairs already answered
+        answered_mask: Answered values per category as bitmasks
+            (GameState.answered_mask; see state.VALUE_BITS)
         values: List of dollar values (rows)
 
     Hint: f-strings with width specifiers help alignment:
         f"{text:^15}"  # Center in 15 chars
         f"{text:<15}"  # Left align in 15 chars
     """
-    for cat in categories:
-        print(f"{cat:^12}", end="")
-    print()
+    masks = [answered_mask.get(cat, 0) for cat in categories]
+    rows = ["".join(f"{cat:^12}" for cat in categories)]
     for value in values:
-        for cat in categories:
-            if (cat, value) in answered:
-                print(f"{'-':^12}", end="")
-            else:
-                print(f"${value:<11}", end="")
-        print()
+        bit = VALUE_BITS[value]
+        rows.append("".join(
+            f"{'-':^12}" if mask & bit else f"${value:<11}"
+            for mask in masks
+        ))
+    # One write for the whole board instead of a print() per cell
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 def display_score(score: int) -> None:
@@ -124,14 +138,14 @@ def display_clue(category: str, value: int, question: str) -> None:
         ════════════════════════════════════════
     """
     print(f"\n{category} for ${value}")
-    print("═" * 40)
+    print(BAR_DOUBLE)
     print(f"{question}")
-    print("═" * 40)
+    print(BAR_DOUBLE)
 
 
 def get_category_selection(
     categories: list[str],
-    answered: set[tuple[str, int]]
+    remaining_per_category: dict[str, int]
 ) -> str | None:
     """
     Prompt player to select a category.
@@ -141,7 +155,7 @@ def get_category_selection(
 
     Args:
         categories: All category names
-        answered: Set of answered (category, value) pairs
+        remaining_per_category: Unanswered clue count for each category
 
     Returns:
         Selected category name, or None if quitting
@@ -158,12 +172,7 @@ def get_category_selection(
     - Handle 'q' or 'quit' to exit
     - Validate the number is in range
     """
-    available = []
-    for cat in categories:
-        for value in STANDARD_VALUES:
-            if (cat, value) not in answered:
-                available.append(cat)
-                break
+    available = [cat for cat in categories if remaining_per_category[cat]]
 
     print("\nSelect a category:")
     for i, cat in enumerate(available, 1):
@@ -287,11 +296,13 @@ def display_game_over(final_score: int, clues_answered: int) -> None:
         Clues Answered: 18/30
         ════════════════════════════════════════
     """
-    print("\n" + "=" * 40)
-    print("         GAME OVER!")
-    print(f"\n  Final Score: ${final_score:,}")
-    print(f"  Clues Answered: {clues_answered}/30")
-    print("=" * 40)
+    sys.stdout.write(
+        f"\n{BAR_SINGLE}\n"
+        "         GAME OVER!\n"
+        f"\n  Final Score: ${final_score:,}\n"
+        f"  Clues Answered: {clues_answered}/30\n"
+        f"{BAR_SINGLE}\n"
+    )
 
 def confirm_quit() -> bool:
     """
@@ -339,50 +350,78 @@ def play_game() -> None:
     show_final_results()
     ```
     """
-    db_path = Path("jeopardy.db")
+    # Imported here rather than at module level so importing the CLI (and
+    # its display helpers) doesn't pay for sqlite3, orjson and friends
+    from .data import load_clean_tsv_data
+    from .database import (
+        create_database,
+        get_board_clues,
+        get_usable_categories_cached,
+        load_clues_to_db,
+    )
 
-    if not db_path.exists():                                                                                  
-          print("Setting up database for first run...")
-          print("Loading clues from TSV (this may take a moment)...")
-          create_database(db_path)
-          raw_clues = load_tsv_data()
-          clues = clean_clues(raw_clues)
-          load_clues_to_db(clues, db_path)
-          print(f"Loaded {len(clues)} clues!")
+    db_path = Path("jeopardy.db")
 
-    all_categories = get_usable_categories(db_path=db_path)
-    categories = random.sample(all_categories, 6)
+    # Prefer the memory-mapped Arrow cache when pyarrow is installed:
+    # opening it is instant, with nothing to parse or query
+    try:
+        from . import arrow_store
+    except ImportError:
+        arrow_store = None
+
+    clue_table = None
+    if arrow_store is not None and arrow_store.CLUE_CACHE_PATH.exists():
+        clue_table = arrow_store.open_clue_cache()
+    elif not db_path.exists():
+        print("Setting up database for first run...")
+        print("Loading clues from TSV (this may take a moment)...")
+        if arrow_store is not None:
+            clue_table = arrow_store.build_clue_cache()
+            print(f"Loaded {clue_table.num_rows} clues!")
+        else:
+            create_database(db_path)
+            clues = load_clean_tsv_data()
+            load_clues_to_db(clues, db_path)
+            print(f"Loaded {len(clues)} clues!")
+
+    if clue_table is not None:
+        all_categories = arrow_store.get_usable_categories(clue_table)
+        categories = random.sample(all_categories, 6)
+        board_clues = arrow_store.get_board_clues(
+            clue_table, categories, STANDARD_VALUES
+        )
+    else:
+        all_categories = get_usable_categories_cached(db_path=db_path)
+        categories = random.sample(all_categories, 6)
+        board_clues = get_board_clues(categories, STANDARD_VALUES, db_path)
 
-    def get_clue(category: str, value: int):
-        return get_random_clue(category, value, db_path)
-    
-    board = generate_board(categories, get_clue)
+    board = generate_board(categories, lambda cat, value: board_clues.get((cat, value)))
 
     state = create_new_game(categories)
 
     while True:
         clear_screen()
-        display_board(categories, state.answered)
+        display_board(categories, state.answered_mask)
         display_score(state.score)
 
-        category = get_category_selection(categories, state.answered)
+        category = get_category_selection(categories, state.remaining_per_category)
         if category is None:
             if confirm_quit():
                 break
             else:
                 continue
 
-        available_values = [v for v in STANDARD_VALUES if (category, v) not in state.answered]
+        available_values = state.get_available_values(category)
         value = get_value_selection(category, available_values)
         if value is None:
             continue
 
-        clue = board[category][value]['clue']
+        clue = board[category, value]['clue']
         display_clue(category, value, clue['question'])
 
         player_answer = get_player_answer()
         if player_answer is None:
-            state.answered.add((category, value))
+            state.mark_answered(category, value)
             continue
 
         correct = check_answer(player_answer, clue['answer'])
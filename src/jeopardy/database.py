@@ -15,23 +15,102 @@ Concepts practiced:
 Why use a database?
 - Fast queries on 200K+ clues
 - Easy to find categories with enough clues at each value
-- Random selection is built into SQL (ORDER BY RANDOM())
+- Random picks are cheap: pick a matching id, then fetch just that row
+  (the board query picks per cell in SQL with ROW_NUMBER())
 """
 
+import json
+import os
+import random
 import sqlite3
+import threading
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from itertools import islice
 from pathlib import Path
 
 
 # Default database location
 DATABASE_PATH = Path(__file__).parent.parent.parent / "data" / "jeopardy.db"
 
-
-def get_connection(db_path: Path = DATABASE_PATH) -> sqlite3.Connection:
+# Applied to every connection by get_connection():
+# - WAL lets readers and a writer work at the same time, and with
+#   synchronous=NORMAL only checkpoints fsync, not every commit
+# - a 64MB page cache and 256MB memory map keep the clue table in RAM
+# The journal mode is stored in the database file, so only read-write
+# connections set it (a read-only one isn't allowed to).
+WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Extra settings for the one-off bulk load. synchronous=OFF skips fsync:
+# if the machine crashes mid-load we just rebuild the database from the TSV.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+)
+
+# The columns of a clue dictionary, in schema order. Named explicitly
+# rather than SELECT * so every query hands back the same keys.
+_CLUE_COLUMNS = "id, category, value, question, answer, round, show_number, air_date"
+
+# Board values for each round (Final Jeopardy has no values)
+ROUND_VALUES = {
+    1: (200, 400, 600, 800, 1000),
+    2: (400, 800, 1200, 1600, 2000),
+}
+
+# Rows per executemany() call, so we never build one 200K-tuple list
+INSERT_BATCH_SIZE = 10_000
+
+# Index name -> indexed columns. Category comes first in the lookup
+# index because it's by far the most selective column; the round-first
+# one serves the category scan, which filters on round.
+INDEXES = {
+    "idx_clues_cvr": "clues (category, value, round)",
+    "idx_clues_rcv": "clues (round, category, value)",
+    "idx_clues_round": "clues (round)",
+}
+
+
+# Full-text index over question and answer for search_clues(). It's an
+# external-content FTS5 table: it stores only the inverted index and reads
+# the text from clues, so it has to be updated after clues changes. It's
+# built on the first search rather than on load, since the game itself
+# never searches; once built, load_clues_to_db keeps it current. The
+# porter tokenizer makes "planets" match "planet".
+SEARCH_TABLE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS clues_fts USING fts5("
+    "question, answer, content='clues', content_rowid='id',"
+    " tokenize='porter unicode61')"
+)
+
+
+def get_connection(
+    db_path: Path = DATABASE_PATH,
+    read_only: bool = False,
+    check_same_thread: bool = True
+) -> sqlite3.Connection:
     """
-    Get a database connection.
+    Get a database connection, tuned with CONNECTION_PRAGMAS.
+
+    Every function in this module opens its connections through here.
+    Rows come back as sqlite3.Row, so dict(row) gives a clue dictionary
+    keyed by column name without us listing the columns.
 
     Args:
         db_path: Path to database file
+        read_only: Open with mode=ro. Query functions use this: SQLite
+            skips write-lock bookkeeping, and with WAL any number of
+            these can read while a writer works
+        check_same_thread: Pass False to let other threads use the
+            connection (e.g. one read-only connection shared by a
+            multi-threaded app; see _connection)
 
     Returns:
         sqlite3.Connection object
@@ -40,10 +119,73 @@ def get_connection(db_path: Path = DATABASE_PATH) -> sqlite3.Connection:
     Better to use create_database() and other functions that manage
     connections internally.
     """
-    return sqlite3.connect(db_path)
+    if read_only:
+        conn = sqlite3.connect(
+            Path(db_path).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=check_same_thread,
+        )
+        pragmas = CONNECTION_PRAGMAS
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+        pragmas = WRITER_PRAGMAS + CONNECTION_PRAGMAS
+    conn.row_factory = sqlite3.Row
+    for pragma in pragmas:
+        conn.execute(pragma)
+    return conn
+
+
+# One open connection per (thread, database file), reused by every query
+# below. Thread-local because sqlite3 connections can't be shared across
+# threads, and both Streamlit and FastAPI run handlers on worker threads.
+_local = threading.local()
+
+
+def _connection(
+    db_path: Path | sqlite3.Connection, read_only: bool = False
+) -> sqlite3.Connection:
+    """
+    Get this thread's cached connection to db_path, opening it if needed.
+
+    The query functions also accept an open connection in place of a
+    path, which is used as-is. Streamlit runs every rerun on a fresh
+    thread, so web.py shares one connection instead of reopening per rerun.
+
+    Skips sqlite3_open, the PRAGMAs and a cold page cache on every call.
+    Use as `with _connection(db_path) as conn:` - the with-block scopes a
+    transaction (commit/rollback) but leaves the connection open.
+    Readers and writers are cached separately (see get_connection).
+    """
+    if isinstance(db_path, sqlite3.Connection):
+        return db_path
+    connections = _local.__dict__.setdefault("connections", {})
+    key = (str(db_path), read_only)
+    conn = connections.get(key)
+    if conn is None:
+        conn = connections[key] = get_connection(db_path, read_only)
+    return conn
+
+
+def _database_file(db_path: Path | sqlite3.Connection) -> Path | sqlite3.Connection:
+    """
+    The file behind an open connection, so it can be reopened for writing.
+
+    Paths pass through; an in-memory connection (no file) comes back as-is.
+    """
+    if not isinstance(db_path, sqlite3.Connection):
+        return db_path
+    # database_list rows are (seq, name, file); "main" is always first
+    filename = db_path.execute("PRAGMA database_list").fetchone()[2]
+    return Path(filename) if filename else db_path
 
 
-def create_database(db_path: Path = DATABASE_PATH) -> None:
+def close_connections() -> None:
+    """Close this thread's cached connections (e.g. before replacing the file)."""
+    for conn in _local.__dict__.pop("connections", {}).values():
+        conn.close()
+
+
+def create_database(db_path: Path | sqlite3.Connection = DATABASE_PATH) -> None:
     """
     Create the Jeopardy database with the clues table.
 
@@ -59,7 +201,8 @@ def create_database(db_path: Path = DATABASE_PATH) -> None:
         - air_date: TEXT
 
     Args:
-        db_path: Where to create the database
+        db_path: Where to create the database, or an open connection
+            (e.g. to ":memory:") to create it in
 
     Example:
         >>> create_database(Path('test.db'))
@@ -70,21 +213,72 @@ def create_database(db_path: Path = DATABASE_PATH) -> None:
     Think about: Should we add any indexes? What queries will be common?
     (category and value lookups are frequent - indexes help!)
     """
-    with sqlite3.connect(db_path) as conn:                                                                        
+    with _connection(db_path) as conn:
       conn.execute("CREATE TABLE IF NOT EXISTS clues (id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT NOT NULL, value INTEGER, question TEXT NOT NULL, answer TEXT NOT NULL, round TEXT NOT NULL, show_number INTEGER, air_date TEXT)")
+    create_indexes(db_path)
+
+
+def create_indexes(db_path: Path | sqlite3.Connection = DATABASE_PATH) -> None:
+    """
+    Add the indexes our queries rely on, if they're missing.
+
+    Safe to call on any existing database (e.g. one decompressed from
+    jeopardy.db.gz, which was built before these indexes existed).
+
+    Indexes (see INDEXES):
+        idx_clues_cvr: (category, value, round) - get_random_clue and
+            board lookups avoid a table scan
+        idx_clues_rcv: (round, category, value) - covers
+            get_usable_categories, which never touches the table itself
+        idx_clues_round: (round) - Final Jeopardy lookups (entries are
+            in id order within a round, which the id-range pick relies on)
+    """
+    with _connection(db_path) as conn:
+        _create_indexes(conn)
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    for name, columns in INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {columns}")
+
+
+def create_search_index(db_path: Path | sqlite3.Connection = DATABASE_PATH) -> None:
+    """
+    (Re)build the full-text search index from the clues table.
+
+    search_clues() builds it on first use and load_clues_to_db() keeps it
+    current after that; call this after writing to the clues table any
+    other way.
+    """
+    with _connection(db_path) as conn:
+        _rebuild_search_index(conn)
+
+
+def _rebuild_search_index(conn: sqlite3.Connection) -> None:
+    conn.execute(SEARCH_TABLE_SQL)
+    conn.execute("INSERT INTO clues_fts (clues_fts) VALUES ('rebuild')")
+
+
+def _has_search_index(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'clues_fts'"
+    ).fetchone() is not None
 
 
 def load_clues_to_db(
-    clues: list[dict],
-    db_path: Path = DATABASE_PATH,
+    clues: Iterable[dict],
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
     clear_existing: bool = True
 ) -> int:
     """
     Insert clues into the database.
 
     Args:
-        clues: List of clue dictionaries
-        db_path: Path to database file
+        clues: Clue dictionaries - any iterable, so a generator (e.g.
+            data.iter_jsonl_file) streams straight in without ever
+            holding the whole corpus in memory
+        db_path: Path to database file, or an open connection to load
+            through (used as-is: no bulk-load PRAGMAs, and left open)
         clear_existing: If True, delete existing clues first
 
     Returns:
@@ -101,16 +295,71 @@ def load_clues_to_db(
     Bad:  f"INSERT INTO clues VALUES ('{clue['category']}')"  # SQL injection!
     Good: "INSERT INTO clues (category) VALUES (?)", (clue['category'],)
     """
-    with sqlite3.connect(db_path) as conn:                                                                        
-      if clear_existing:
-        conn.execute("DELETE FROM clues")
-      conn.executemany("INSERT INTO clues (category, value, question, answer, round, show_number, air_date) VALUES (?, ?, ?, ?, ?, ?, ?)", [(clue['category'], clue['value'], clue['question'], clue['answer'], clue['round'], clue['show_number'], clue['air_date']) for clue in clues])
-      return len(clues)
+    rows = (
+        (clue['category'], clue['value'], clue['question'], clue['answer'],
+         clue['round'], clue['show_number'], clue['air_date'])
+        for clue in clues
+    )
+
+    # Autocommit mode so we control the transaction ourselves:
+    # one BEGIN and one COMMIT for the whole load
+    owned = not isinstance(db_path, sqlite3.Connection)
+    conn = get_connection(db_path) if owned else db_path
+    isolation_level, conn.isolation_level = conn.isolation_level, None
+    try:
+        if owned:
+            for pragma in BULK_LOAD_PRAGMAS:
+                conn.execute(pragma)
+        conn.execute("BEGIN")
+        # Only a database that has been searched has the index to keep up
+        # to date (see SEARCH_TABLE_SQL)
+        indexed = _has_search_index(conn)
+        if clear_existing:
+            conn.execute("DELETE FROM clues")
+            if indexed:
+                # Cheaper to drop it than to rebuild it for a search that
+                # may never come; the next search_clues() builds it again
+                conn.execute("DROP TABLE clues_fts")
+            # Building an index once over the finished table is much faster
+            # than updating it on every insert, so drop them for the load
+            for name in INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        elif indexed:
+            last_id = conn.execute("SELECT MAX(id) FROM clues").fetchone()[0]
+        count = 0
+        while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+            conn.executemany(
+                "INSERT INTO clues (category, value, question, answer, round,"
+                " show_number, air_date) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch
+            )
+            count += len(batch)
+        if clear_existing:
+            _create_indexes(conn)
+        elif indexed:
+            # Index just the appended rows
+            conn.execute(
+                "INSERT INTO clues_fts (rowid, question, answer)"
+                " SELECT id, question, answer FROM clues WHERE id > ?",
+                (last_id or 0,)
+            )
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        if owned:
+            conn.close()
+        else:
+            conn.isolation_level = isolation_level
+    return count
+
 
 def get_random_clue(
     category: str,
     value: int,
-    db_path: Path = DATABASE_PATH,
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
     round_num: int | None = None
 ) -> dict | None:
     """
@@ -119,32 +368,99 @@ def get_random_clue(
     Args:
         category: Category name
         value: Dollar value (200, 400, 600, 800, 1000 for round 1; 400, 800, 1200, 1600, 2000 for round 2)
-        db_path: Path to database
+        db_path: Path to database, or an open connection to use
         round_num: Optional round filter (1 for Jeopardy, 2 for Double Jeopardy)
 
     Returns:
         Clue dictionary or None if no matching clue exists
     """
-    with sqlite3.connect(db_path) as conn:
+    with _connection(db_path, read_only=True) as conn:
+        # Fetch just the matching ids (straight from idx_clues_cvr) and pick
+        # one in Python, rather than ORDER BY RANDOM() sorting whole rows
         if round_num is not None:
-            row = conn.execute(
-                "SELECT * FROM clues WHERE category = ? AND value = ? AND round = ? ORDER BY RANDOM() LIMIT 1",
+            ids = conn.execute(
+                "SELECT id FROM clues WHERE category = ? AND value = ? AND round = ?",
                 (category, value, str(round_num))
-            ).fetchone()
+            ).fetchall()
         else:
-            row = conn.execute(
-                "SELECT * FROM clues WHERE category = ? AND value = ? ORDER BY RANDOM() LIMIT 1",
+            ids = conn.execute(
+                "SELECT id FROM clues WHERE category = ? AND value = ?",
                 (category, value)
-            ).fetchone()
-        if row is None:
+            ).fetchall()
+        if not ids:
             return None
-        columns = ["id", "category", "value", "question", "answer", "round", "show_number", "air_date"]
-        return dict(zip(columns, row))
+        row = conn.execute(
+            f"SELECT {_CLUE_COLUMNS} FROM clues WHERE id = ?", tuple(random.choice(ids))
+        ).fetchone()
+        return dict(row)
+
+
+def get_board_clues(
+    categories: list[str],
+    values: list[int],
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
+    round_num: int | None = None
+) -> dict[tuple[str, int], dict]:
+    """
+    Pick one random clue for every (category, value) cell in a single query.
 
+    Equivalent to calling get_random_clue() for each cell, but with one
+    round trip instead of len(categories) * len(values).
+
+    Args:
+        categories: Category names on the board
+        values: Dollar values on the board
+        db_path: Path to database, or an open connection to use
+        round_num: Optional round filter (1 for Jeopardy, 2 for Double Jeopardy)
+
+    Returns:
+        Dictionary mapping (category, value) to a clue dictionary.
+        Cells with no matching clue are left out.
+
+    Example:
+        >>> clues = get_board_clues(['SCIENCE', 'HISTORY'], [200, 400])
+        >>> clues[('SCIENCE', 400)]['answer']
+        'Mars'
+    """
+    category_marks = ", ".join("?" * len(categories))
+    value_marks = ", ".join("?" * len(values))
+    where = f"category IN ({category_marks}) AND value IN ({value_marks})"
+    params = [*categories, *values]
+    if round_num is not None:
+        where += " AND round = ?"
+        params.append(str(round_num))
+
+    # Number each cell's candidates in random order and keep number 1,
+    # so SQLite hands back exactly one row per (category, value)
+    query = f"""SELECT {_CLUE_COLUMNS} FROM (
+        SELECT {_CLUE_COLUMNS}, ROW_NUMBER() OVER (
+            PARTITION BY category, value ORDER BY RANDOM()
+        ) AS pick
+        FROM clues WHERE {where}
+    ) WHERE pick = 1"""
+
+    with _connection(db_path, read_only=True) as conn:
+        rows = conn.execute(query, params).fetchall()
+    return {(row["category"], row["value"]): dict(row) for row in rows}
+
+
+# Both rounds have five values, so each query below has one fixed SQL text
+# for every round and call: sqlite3's statement cache compiles it once per
+# connection. Both read only idx_clues_rcv (round, category, value), whose
+# rows come out already grouped by category.
+_USABLE_CATEGORIES_SQL = """SELECT category FROM clues
+    WHERE value IN (?, ?, ?, ?, ?) AND round = ?
+    GROUP BY category HAVING COUNT(DISTINCT value) = ?"""
+_USABLE_CATEGORIES_MIN_SQL = """SELECT category FROM (
+        SELECT category, value FROM clues
+        WHERE value IN (?, ?, ?, ?, ?) AND round = ?
+        GROUP BY category, value
+        HAVING COUNT(*) >= ?
+    ) GROUP BY category HAVING COUNT(*) = ?"""
 
 def get_usable_categories(
     min_clues_per_value: int = 1,
-    db_path: Path = DATABASE_PATH,
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
     round_num: int = 1
 ) -> list[str]:
     """
@@ -152,45 +468,146 @@ def get_usable_categories(
 
     Args:
         min_clues_per_value: Minimum clues needed at each value
-        db_path: Path to database
+        db_path: Path to database, or an open connection to use
         round_num: 1 for Jeopardy (200-1000), 2 for Double Jeopardy (400-2000)
 
     Returns:
         List of category names that are "complete" for a game board
     """
-    if round_num == 1:
-        values = (200, 400, 600, 800, 1000)
+    values = ROUND_VALUES[1] if round_num == 1 else ROUND_VALUES[2]
+
+    # Any clue at a value is enough for min 1, so one pass counting
+    # distinct values will do
+    if min_clues_per_value <= 1:
+        query = _USABLE_CATEGORIES_SQL
+        params = (*values, str(round_num), len(values))
     else:
-        values = (400, 800, 1200, 1600, 2000)
+        query = _USABLE_CATEGORIES_MIN_SQL
+        params = (*values, str(round_num), min_clues_per_value, len(values))
+    with _connection(db_path, read_only=True) as conn:
+        rows = conn.execute(query, params).fetchall()
+        return [row["category"] for row in rows]
+
+
+def _db_stamp(db_path: Path) -> tuple:
+    """
+    Fingerprint the database files so we notice when the data changes.
+
+    The read-only aggregates below (category scan, counts) are memoized
+    with lru_cache and take this stamp as an argument, so any write to the
+    database turns the next call into a cache miss.
+
+    In WAL mode recent commits live in the -wal file until a checkpoint,
+    so its mtime and size count too, not just the main file's.
+    """
+    stamp = []
+    for path in _db_files(db_path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
 
-    with sqlite3.connect(db_path) as conn:
-        rows = conn.execute(
-            f"""SELECT category FROM (
-                SELECT category, value FROM clues
-                WHERE value IN {values} AND round = ?
-                GROUP BY category, value
-                HAVING COUNT(*) >= ?
-            ) GROUP BY category HAVING COUNT(*) = 5""",
-            (str(round_num), min_clues_per_value)
-        ).fetchall()
-        return [row[0] for row in rows]
+@cache
+def _db_files(db_path: Path) -> tuple[str, str]:
+    """
+    The database and -wal file paths as plain strings, worked out once.
+
+    _db_stamp runs on every cached query, and building the -wal Path and
+    stat()-ing through pathlib cost more than the stat calls themselves.
+    """
+    path = os.fspath(db_path)
+    return path, path + "-wal"
 
 
-def get_final_jeopardy_clue(db_path: Path = DATABASE_PATH) -> dict | None:
+@lru_cache(maxsize=32)
+def _cached_usable_categories(
+    db_path: Path,
+    stamp: tuple,
+    min_clues_per_value: int,
+    round_num: int
+) -> tuple[str, ...]:
+    """
+    Sidecar-backed get_usable_categories for one database version.
+
+    stamp is part of the lru_cache key, so a changed database is a miss.
+    """
+    cache_path = db_path.with_suffix(".categories.json")
+    key = f"{round_num}:{min_clues_per_value}"
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cached = {}
+    # JSON turns tuples into lists, so compare in that form
+    stamp_json = json.loads(json.dumps(stamp))
+    if cached.get("stamp") != stamp_json:
+        cached = {"stamp": stamp_json, "categories": {}}
+    if key in cached["categories"]:
+        return tuple(cached["categories"][key])
+
+    categories = get_usable_categories(min_clues_per_value, db_path, round_num)
+    cached["categories"][key] = categories
+    try:
+        cache_path.write_text(json.dumps(cached))
+    except OSError:
+        pass  # Read-only install: still correct, just not persisted
+    return tuple(categories)
+
+
+def get_usable_categories_cached(
+    min_clues_per_value: int = 1,
+    db_path: Path = DATABASE_PATH,
+    round_num: int = 1
+) -> list[str]:
+    """
+    Cached version of get_usable_categories.
+
+    The category scan only changes when the database does, so results are
+    saved to a small JSON file next to the database (jeopardy.categories.json)
+    and memoized in-process. Both are keyed by the database's mtime and
+    size, so rebuilding the database invalidates them.
+
+    Args:
+        min_clues_per_value: Minimum clues needed at each value
+        db_path: Path to database
+        round_num: 1 for Jeopardy (200-1000), 2 for Double Jeopardy (400-2000)
+
+    Returns:
+        List of category names that are "complete" for a game board
+    """
+    db_path = Path(db_path)
+    stamp = _db_stamp(db_path)
+    return list(
+        _cached_usable_categories(db_path, stamp, min_clues_per_value, round_num)
+    )
+
+
+def get_final_jeopardy_clue(
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
+) -> dict | None:
     """
     Get a random Final Jeopardy clue.
 
+    Args:
+        db_path: Path to database, or an open connection to use
+
     Returns:
         Clue dictionary with category, question, answer, or None if none found
     """
-    with sqlite3.connect(db_path) as conn:
+    with _connection(db_path, read_only=True) as conn:
+        # Same as get_random_clue: fetch just the round-3 ids (straight
+        # from idx_clues_round) and pick one uniformly in Python, rather
+        # than ORDER BY RANDOM() sorting whole rows
+        ids = conn.execute("SELECT id FROM clues WHERE round = '3'").fetchall()
+        if not ids:
+            return None
         row = conn.execute(
-            "SELECT * FROM clues WHERE round = '3' ORDER BY RANDOM() LIMIT 1"
+            f"SELECT {_CLUE_COLUMNS} FROM clues WHERE id = ?", tuple(random.choice(ids))
         ).fetchone()
-        if row is None:
-            return None
-        columns = ["id", "category", "value", "question", "answer", "round", "show_number", "air_date"]
-        return dict(zip(columns, row))
+        return dict(row)
 
 
 def count_clues_by_category(db_path: Path = DATABASE_PATH) -> dict[str, int]:
@@ -207,9 +624,17 @@ def count_clues_by_category(db_path: Path = DATABASE_PATH) -> dict[str, int]:
 
     SQL Hint: SELECT category, COUNT(*) ... GROUP BY category
     """
-    with sqlite3.connect(db_path) as conn:
-        rows = conn.execute("SELECT category, COUNT(*) FROM clues GROUP BY category").fetchall()
-        return {row[0]: row[1] for row in rows}
+    return dict(_count_clues_by_category(db_path, _db_stamp(db_path)))
+
+
+@lru_cache(maxsize=32)
+def _count_clues_by_category(
+    db_path: Path, stamp: tuple
+) -> tuple[tuple[str, int], ...]:
+    with _connection(db_path, read_only=True) as conn:
+        return tuple(conn.execute(
+            "SELECT category, COUNT(*) FROM clues GROUP BY category"
+        ).fetchall())
 
 
 def get_category_value_counts(
@@ -232,9 +657,18 @@ def get_category_value_counts(
 
     Useful for checking if a category can fill a game board column.
     """
-    with sqlite3.connect(db_path) as conn:
-        rows = conn.execute("SELECT value, COUNT(*) FROM clues WHERE category = ? GROUP BY value", (category,)).fetchall()
-        return {row[0]: row[1] for row in rows}
+    return dict(_get_category_value_counts(category, db_path, _db_stamp(db_path)))
+
+
+@lru_cache(maxsize=256)
+def _get_category_value_counts(
+    category: str, db_path: Path, stamp: tuple
+) -> tuple[tuple[int, int], ...]:
+    with _connection(db_path, read_only=True) as conn:
+        return tuple(conn.execute(
+            "SELECT value, COUNT(*) FROM clues WHERE category = ? GROUP BY value",
+            (category,)
+        ).fetchall())
 
 
 def get_total_clue_count(db_path: Path = DATABASE_PATH) -> int:
@@ -246,14 +680,18 @@ def get_total_clue_count(db_path: Path = DATABASE_PATH) -> int:
 
     SQL: SELECT COUNT(*) FROM clues
     """
-    with sqlite3.connect(db_path) as conn:
-        row = conn.execute("SELECT COUNT(*) FROM clues").fetchone()
-        return row[0]
+    return _get_total_clue_count(db_path, _db_stamp(db_path))
+
+
+@lru_cache(maxsize=32)
+def _get_total_clue_count(db_path: Path, stamp: tuple) -> int:
+    with _connection(db_path, read_only=True) as conn:
+        return conn.execute("SELECT COUNT(*) FROM clues").fetchone()[0]
 
 
 def search_clues(
     search_term: str,
-    db_path: Path = DATABASE_PATH,
+    db_path: Path | sqlite3.Connection = DATABASE_PATH,
     limit: int = 10
 ) -> list[dict]:
     """
@@ -261,13 +699,39 @@ def search_clues(
 
     Args:
         search_term: Text to search for
-        db_path: Path to database
+        db_path: Path to database, or an open connection to use
         limit: Maximum results to return
 
     Returns:
         List of matching clue dictionaries
 
-    SQL Hint: Use LIKE with % wildcards for partial matching
-    Example: WHERE question LIKE '%mars%' OR answer LIKE '%mars%'
+    Uses the clues_fts full-text index rather than LIKE '%term%', which
+    can't use an index and has to read every clue. Each word in
+    search_term is matched as a word prefix ("mar" finds "Mars"), and
+    every word must appear in the question or answer.
+
+    Example:
+        >>> search_clues('red planet')[0]['answer']
+        'Mars'
     """
-    pass
+    # Quote each word so punctuation in the search ("AT&T", "-") isn't
+    # parsed as FTS5 query syntax; the trailing * makes it a prefix match
+    words = search_term.split()
+    if not words:
+        return []
+    query = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+    sql = """SELECT clues.* FROM clues_fts JOIN clues ON clues.id = clues_fts.rowid
+        WHERE clues_fts MATCH ? LIMIT ?"""
+    with _connection(db_path, read_only=True) as conn:
+        try:
+            rows = conn.execute(sql, (query, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+            # First search on this database. Build the index through a
+            # writer: a connection passed in may be read-only
+            # (web.py shares one), so go to its file instead
+            create_search_index(_database_file(db_path))
+            rows = conn.execute(sql, (query, limit)).fetchall()
+    return [dict(row) for row in rows]
@@ -17,6 +17,9 @@ Concepts practiced:
 - Type hints (notebook 05)
 """
 
+import random
+import re
+from functools import lru_cache
 from typing import TypedDict, Callable
 from rapidfuzz import fuzz
 
@@ -34,15 +37,80 @@ class BoardSlot(TypedDict):
     answered: bool
 
 
-# Type alias for the game board
-# Board maps: category -> value -> BoardSlot
-Board = dict[str, dict[int, BoardSlot]]
+class _Slot(dict):
+    """A BoardSlot that reports writes to 'answered' back to its Board."""
+
+    __slots__ = ('_board', '_index')
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if key == 'answered':
+            self._board._set_answered(self._index, value)
+
+
+class Board(dict[tuple[str, int], BoardSlot]):
+    """
+    The game board: maps (category, value) -> BoardSlot.
+
+    One flat dict rather than category -> value -> slot: a single hash per
+    lookup. It also keeps a running count of unanswered slots, so
+    count_remaining() and is_board_complete() don't scan the board.
+
+    flags mirrors the answered bits as one byte per slot, in board order
+    (category-major, as generate_board builds it). That order can't change,
+    since the cells are fixed (see below), so simulations that play many
+    games can snapshot a board, or compare boards built from the same
+    categories and values, with bytes(board.flags) instead of walking 30
+    slot dicts.
+
+    Slots are stored as small dict subclasses that update flags and
+    remaining whenever slot['answered'] is assigned, so setting it
+    directly stays in sync just like mark_clue_answered() does.
+
+    The cells are fixed once the board is built: adding, replacing or
+    removing one raises TypeError, since flags is indexed by position.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for index, (cell, slot) in enumerate(list(self.items())):
+            slot = _Slot(slot)
+            slot._board = self
+            slot._index = index
+            super().__setitem__(cell, slot)
+        self.flags = bytearray(bool(slot['answered']) for slot in self.values())
+        self.remaining = self.flags.count(0)
+
+    def _set_answered(self, index: int, answered: bool) -> None:
+        flag = 1 if answered else 0
+        if self.flags[index] != flag:
+            self.flags[index] = flag
+            self.remaining += -1 if flag else 1
+
+    def _fixed(self, *args, **kwargs):
+        raise TypeError(
+            "Board cells are fixed once built; set slot['answered'] instead"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _fixed
+    pop = popitem = setdefault = update = clear = _fixed
+
+    def __reduce__(self):
+        # copy and pickle would otherwise refill the copy through __setitem__
+        return type(self), ({cell: dict(slot) for cell, slot in self.items()},)
+
 
 # Standard Jeopardy values
 STANDARD_VALUES = [200, 400, 600, 800, 1000]
 DOUBLE_JEOPARDY_VALUES = [400, 800, 1200, 1600, 2000]
 
+# Answer prefixes to drop, in any order and any number ("what is the ...").
+# One regex + one translate replace a removeprefix/replace loop per word.
+_PREFIX_RE = re.compile(r"^(?:(?:(?:what|who) (?:is|are)|what'?s|who'?s|the|an?)\s+)+")
+_PUNCTUATION = str.maketrans("", "", ".?!,;:")
+
 
+@lru_cache(maxsize=8192)
 def normalize_answer(answer: str) -> str:
     """
     Normalize an answer for comparison.
@@ -75,16 +143,11 @@ def normalize_answer(answer: str) -> str:
     - Use string methods: .lower(), .strip(), .startswith(), .replace()
     - The `re` module can help with punctuation removal
     """
-    prefixes = ["what is ", "who is ", "what are ", "who are ", "the ", "a ", "an ", "what's ", "whats ", "who's ", "whos "]
-    sufixes = [".", "?", "!", ",", ";", ":"]
-    result = answer.lower().strip()
-    for prefix in prefixes:
-        result = result.removeprefix(prefix).strip()
-    for sufix in sufixes:
-        result = result.replace(sufix, "")
-    return result
+    result = _PREFIX_RE.sub("", answer.lower().strip())
+    return result.translate(_PUNCTUATION).strip()
 
 
+@lru_cache(maxsize=8192)
 def check_answer(player_answer: str, correct_answer: str) -> bool:
     """
     Check if player's answer matches the correct answer.
@@ -108,20 +171,92 @@ def check_answer(player_answer: str, correct_answer: str) -> bool:
 
     Future enhancement: Could add fuzzy matching for close answers
     (e.g., "Shakespear" vs "Shakespeare")
+
+    Both this and normalize_answer() are pure, so they're memoized with
+    lru_cache: replayed or repeated (player, correct) pairs skip the
+    normalization and fuzzy scoring entirely.
+    """
+    return check_normalized_answer(player_answer, normalize_answer(correct_answer))
+
+
+def check_normalized_answer(player_answer: str, correct_norm: str) -> bool:
+    """
+    check_answer() for a correct answer that's already been normalized.
+
+    For callers that check several guesses against one clue (buzz-backs,
+    Final Jeopardy): normalize the correct answer once when the clue is
+    shown, then pass that in.
+
+    Args:
+        player_answer: What the player typed
+        correct_norm: normalize_answer() of the correct response
+
+    Returns:
+        True if the answers match, same as check_answer()
     """
-    # Normalize both answers first
     player_norm = normalize_answer(player_answer)
-    correct_norm = normalize_answer(correct_answer)
 
     if player_norm == correct_norm:
         return True
-    if fuzz.ratio(player_norm, correct_norm) >= 80:
+    if not player_norm or not correct_norm:
+        return False
+    # ratio() is at most 2*shorter/(shorter+longer), which is below 80
+    # once the shorter string is under 2/3 of the longer - skip the DP.
+    # partial_ratio() still runs: it's meant for "Washington" vs
+    # "George Washington". score_cutoff lets rapidfuzz stop early.
+    shorter, longer = sorted((len(player_norm), len(correct_norm)))
+    close_in_length = 3 * shorter >= 2 * longer
+    if close_in_length and fuzz.ratio(player_norm, correct_norm, score_cutoff=80):
         return True
-    if fuzz.partial_ratio(player_norm, correct_norm) >= 90:
+    if fuzz.partial_ratio(player_norm, correct_norm, score_cutoff=90):
         return True
     return False
 
 
+def check_answers_batch(
+    player_answers: list[str], correct_answers: list[str]
+) -> list[bool]:
+    """
+    Check many (player, correct) answer pairs at once.
+
+    Same result as [check_answer(p, c) for p, c in zip(...)], for bots and
+    test harnesses that grade thousands of guesses. The fuzzy scores come
+    from rapidfuzz's cpdist, which scores every pair in one C call (spread
+    over all cores) instead of two Python-level calls per pair.
+
+    Args:
+        player_answers: What the players typed
+        correct_answers: The correct responses, pairwise with player_answers
+
+    Returns:
+        One bool per pair
+
+    Raises:
+        ValueError: If the two lists have different lengths
+    """
+    if len(player_answers) != len(correct_answers):
+        raise ValueError("player_answers and correct_answers must be the same length")
+
+    try:
+        from rapidfuzz.process import cpdist
+        players = [normalize_answer(answer) for answer in player_answers]
+        corrects = [normalize_answer(answer) for answer in correct_answers]
+        ratios = cpdist(
+            players, corrects, scorer=fuzz.ratio, score_cutoff=80, workers=-1
+        )
+        partials = cpdist(
+            players, corrects, scorer=fuzz.partial_ratio, score_cutoff=90, workers=-1
+        )
+    except ImportError:
+        # cpdist returns a NumPy array; without NumPy grade one pair at a time
+        return [check_answer(p, c) for p, c in zip(player_answers, correct_answers)]
+
+    return [
+        player == correct or bool(ratio) or bool(partial)
+        for player, correct, ratio, partial in zip(players, corrects, ratios, partials)
+    ]
+
+
 def calculate_score_change(value: int, correct: bool) -> int:
     """
     Calculate how the score changes based on answer correctness.
@@ -174,16 +309,35 @@ def generate_board(
     if values is None:
         values = STANDARD_VALUES
 
-    board = {}
-    for category in categories:
-        board[category] = {}
-        for value in values:
-            clue = get_clue_fn(category, value)
-            if clue is not None:
-                board[category][value] = {'clue': clue, 'answered': False}
-            else:
-                board[category][value] = {'clue': None, 'answered': False}
-    return board
+    return Board(
+        ((category, value), {'clue': get_clue_fn(category, value), 'answered': False})
+        for category in categories
+        for value in values
+    )
+
+
+def pick_daily_doubles(
+    categories: list[str], values: list[int], count: int
+) -> set[tuple[str, int]]:
+    """
+    Choose which board positions hide a Daily Double.
+
+    Samples flat indices into the categories x values grid and maps them
+    back, so the grid itself is never built.
+
+    Args:
+        categories: The round's categories
+        values: The round's dollar values
+        count: How many Daily Doubles (1 in Jeopardy, 2 in Double Jeopardy)
+
+    Returns:
+        Set of (category, value) positions
+    """
+    n_values = len(values)
+    return {
+        (categories[i // n_values], values[i % n_values])
+        for i in random.sample(range(len(categories) * n_values), count)
+    }
 
 
 def is_board_complete(board: Board) -> bool:
@@ -204,11 +358,7 @@ def is_board_complete(board: Board) -> bool:
         >>> is_board_complete(board)
         True
     """
-    for category_slots in board.values():
-        for slot in category_slots.values():
-            if not slot['answered']:
-                return False
-    return True
+    return board.remaining == 0
 
 
 def get_remaining_clues(board: Board) -> list[tuple[str, int]]:
@@ -228,12 +378,9 @@ def get_remaining_clues(board: Board) -> list[tuple[str, int]]:
 
     Useful for: displaying available selections, checking if game is over
     """
-    remaining = []
-    for category, category_slots in board.items():
-        for value, slot in category_slots.items():
-            if not slot['answered']:
-                remaining.append((category, value))
-    return remaining
+    # board.flags is in board order, so zip pairs each cell with its flag
+    # without touching the slot dicts
+    return [cell for cell, answered in zip(board, board.flags) if not answered]
 
 
 def get_clue_from_board(board: Board, category: str, value: int) -> Clue | None:
@@ -248,10 +395,9 @@ def get_clue_from_board(board: Board, category: str, value: int) -> Clue | None:
     Returns:
         The Clue dict, or None if not found or already answered
     """
-    if category in board and value in board[category]:
-        slot = board[category][value]
-        if not slot['answered']:
-            return slot['clue']
+    slot = board.get((category, value))
+    if slot is not None and not slot['answered']:
+        return slot['clue']
     return None
 
 
@@ -270,11 +416,12 @@ def mark_clue_answered(board: Board, category: str, value: int) -> bool:
     Note: This modifies the board in place. In a more functional style,
     you'd return a new board, but mutation is clearer for beginners.
     """
-    if category not in board or value not in board[category]:
+    slot = board.get((category, value))
+    if slot is None:
         return False
-    board[category][value]['answered'] = True
+    slot['answered'] = True
     return True
-    
+
 
 
 def count_remaining(board: Board) -> int:
@@ -287,4 +434,4 @@ def count_remaining(board: Board) -> int:
     Returns:
         Number of unanswered clues
     """
-    return len(get_remaining_clues(board))
+    return board.remaining
@@ -9,6 +9,7 @@ This module handles:
 """
 
 import asyncio
+import itertools
 import json
 import random
 import string
@@ -17,13 +18,43 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
-
-from jeopardy.database import get_usable_categories, get_random_clue, get_final_jeopardy_clue
-from jeopardy.game import STANDARD_VALUES, DOUBLE_JEOPARDY_VALUES, check_answer, generate_board
+from websockets.exceptions import ConnectionClosed
+
+from jeopardy.database import (
+    create_indexes,
+    get_board_clues,
+    get_final_jeopardy_clue,
+    get_usable_categories_cached,
+)
+from jeopardy.game import (
+    DOUBLE_JEOPARDY_VALUES,
+    STANDARD_VALUES,
+    check_normalized_answer,
+    generate_board,
+    normalize_answer,
+    pick_daily_doubles,
+)
+
+# All websocket traffic is JSON text. orjson encodes and decodes several
+# times faster than the stdlib json module; broadcasts are encoded once
+# and the same string is sent to every player.
+try:
+    import orjson
+
+    def encode_message(message: dict) -> str:
+        return orjson.dumps(message).decode()
+
+    decode_message = orjson.loads
+except ImportError:
+    def encode_message(message: dict) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    decode_message = json.loads
 
 # Find database - check multiple locations
 def _find_db():
@@ -49,20 +80,38 @@ DD_WAGER_TIME = 10      # Time to place Daily Double wager
 FJ_WAGER_TIME = 30      # Time to place Final Jeopardy wager
 FJ_ANSWER_TIME = 30     # Time to answer Final Jeopardy
 
+# Messages a player's connection may fall behind by before we drop them
+SEND_QUEUE_SIZE = 64
+
+# Players to enqueue a broadcast for before yielding to the event loop
+BROADCAST_BATCH_SIZE = 32
+
+# Rooms that are over or have nobody connected are reaped after this long idle
+ROOM_IDLE_TIMEOUT = 30 * 60
+ROOM_REAP_INTERVAL = 60
+
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in a multiplayer game."""
     id: str
     name: str
     score: int = 0
     websocket: WebSocket = None
+    # Outgoing messages, drained into the websocket by relay_messages()
+    send_queue: asyncio.Queue = None
+    relay_task: asyncio.Task = None
+    # id and name never change after joining, so build that part once
+    _static: dict = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._static = {"id": self.id, "name": self.name}
 
     def to_dict(self):
-        return {"id": self.id, "name": self.name, "score": self.score}
+        return {**self._static, "score": self.score}
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRoom:
     """Represents a multiplayer game room."""
     room_id: str
@@ -74,11 +123,13 @@ class GameRoom:
     categories: List[str] = field(default_factory=list)
     board: dict = field(default_factory=dict)
     values: List[int] = field(default_factory=list)
+    max_board_value: int = 0  # max(values), set once per round for wager limits
     daily_doubles: set = field(default_factory=set)
     answered: set = field(default_factory=set)
 
     # Current clue state
     current_clue: dict = None
+    current_answer_norm: str = None  # normalize_answer(current_clue["answer"])
     current_category: str = None
     current_value: int = None
 
@@ -87,8 +138,10 @@ class GameRoom:
     buzzed_player: str = None
     buzz_time: float = None
     wrong_buzzers: set = field(default_factory=set)  # Players who got it wrong this clue
-    buzz_timer_id: int = 0  # Increments each time buzz window opens, used to cancel old timers
-    answer_timer_id: int = 0  # Increments each time answer phase starts, used to cancel old timers
+    # Pending close_buzzer_after_delay(), cancelled when the buzzer reopens
+    buzz_task: asyncio.Task = None
+    # Pending dd_answer_timeout(), cancelled once an answer is in
+    answer_task: asyncio.Task = None
 
     # Board control - who picks the next clue (starts with host, changes when someone answers correctly)
     board_controller: str = None
@@ -97,11 +150,13 @@ class GameRoom:
     dd_wager: int = 0
     dd_player: str = None  # Player who selected the Daily Double
 
-    # Timers
+    # Timers (time.monotonic(), never sent to clients)
     clue_shown_time: float = None
     answer_deadline: float = None
 
-    # Game phase: "lobby", "selecting", "showing_clue", "buzz_open", "answering", "showing_answer", "round_end", "fj_wagering", "fj_clue", "fj_answering", "fj_reveal", "game_over"
+    # Game phase: "lobby", "loading", "selecting", "showing_clue", "buzz_open",
+    # "answering", "showing_answer", "round_end", "fj_wagering", "fj_clue",
+    # "fj_answering", "fj_reveal", "game_over"
     phase: str = "lobby"
 
     # Final Jeopardy state
@@ -110,13 +165,24 @@ class GameRoom:
     fj_answers: Dict[str, str] = field(default_factory=dict)  # player_id -> answer
     fj_wagers_received: set = field(default_factory=set)  # Players who submitted wagers
     fj_answers_received: set = field(default_factory=set)  # Players who submitted answers
+    # Pending fj_wager_timeout(), cancelled once all wagers are in
+    fj_wager_task: asyncio.Task = None
+    # Pending fj_answer_timeout(), cancelled once all answers are in
+    fj_answer_task: asyncio.Task = None
+
+    # time.monotonic() of the last message from any player, for reap_idle_rooms()
+    last_activity: float = field(default_factory=time.monotonic)
+
+    def player_dicts(self):
+        """Every player's to_dict(), keyed by id - sent with each score change."""
+        return {pid: p.to_dict() for pid, p in self.players.items()}
 
     def to_dict(self):
         return {
             "room_id": self.room_id,
             "host_id": self.host_id,
             "board_controller": self.board_controller,
-            "players": {pid: p.to_dict() for pid, p in self.players.items()},
+            "players": self.player_dicts(),
             "round_num": self.round_num,
             "categories": self.categories,
             "values": self.values,
@@ -134,12 +200,38 @@ class GameRoom:
 rooms: Dict[str, GameRoom] = {}
 
 
+def remove_player(room: GameRoom, player: Player):
+    """Drop a player from their room, and the room once it is empty."""
+    if room.players.get(player.id) is player:
+        del room.players[player.id]
+    if not room.players and rooms.get(room.room_id) is room:
+        # Nothing else holds on to an empty room, so free its code
+        del rooms[room.room_id]
+        cancel_room_timers(room)
+
+
+# Room codes walk all 26**4 four-letter codes in a scrambled order: a
+# counter times a step coprime to 26**4, from a random start. Every code
+# comes up once before any repeats, so a new code is free on the first
+# try instead of re-rolling random codes as the room table fills up.
+ROOM_CODE_SPACE = 26 ** 4
+_ROOM_CODE_STEP = 7919  # Prime, and not 2 or 13, so coprime to 26**4
+_room_counter = itertools.count(random.randrange(ROOM_CODE_SPACE))
+
+
 def generate_room_id() -> str:
     """Generate a unique 4-character room code."""
-    while True:
-        code = ''.join(random.choices(string.ascii_uppercase, k=4))
+    for _ in range(ROOM_CODE_SPACE):
+        n = next(_room_counter) * _ROOM_CODE_STEP % ROOM_CODE_SPACE
+        letters = []
+        for _ in range(4):
+            n, digit = divmod(n, 26)
+            letters.append(string.ascii_uppercase[digit])
+        code = ''.join(letters)
+        # Only possible once the counter has wrapped all the way round
         if code not in rooms:
             return code
+    raise RuntimeError("All room codes are in use")
 
 
 def generate_player_id() -> str:
@@ -147,39 +239,149 @@ def generate_player_id() -> str:
     return ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
 
 
-async def broadcast_to_room(room: GameRoom, message: dict):
-    """Send a message to all players in a room."""
-    disconnected = []
-    for player_id, player in room.players.items():
-        if player.websocket:
-            try:
-                await player.websocket.send_json(message)
-            except:
-                disconnected.append(player_id)
-    # Clean up disconnected players
-    for pid in disconnected:
-        del room.players[pid]
+async def relay_messages(room: GameRoom, player: Player):
+    """
+    Drain a player's send queue into their websocket, one message at a time.
 
+    Runs as a task for as long as the player is connected. This is the only
+    place that awaits the network, so a slow client only delays its own
+    messages - game logic just enqueues and carries on.
 
-async def send_to_player(player: Player, message: dict):
+    Messages that pile up while a send is in flight (e.g. answer_result
+    then round_complete) go out together as one
+    {"type": "multi", "payload": [...]} frame, which the page unpacks.
+    """
+    websocket, queue = player.websocket, player.send_queue
+    try:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if len(batch) == 1:
+                await websocket.send_text(batch[0])
+            else:
+                # The payloads are already JSON, so splice rather than re-encode
+                payload = ",".join(batch)
+                await websocket.send_text(
+                    '{"type":"multi","payload":[' + payload + "]}"
+                )
+    except (WebSocketDisconnect, ConnectionClosed, RuntimeError):
+        # The connection is gone (RuntimeError: sending after close); so is
+        # the player. Anything else, including cancellation, propagates.
+        remove_player(room, player)
+
+
+def start_relay(room: GameRoom, player: Player, websocket: WebSocket):
+    """Attach a websocket to a player and start relaying their messages."""
+    stop_relay(player)
+    player.websocket = websocket
+    player.send_queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+    player.relay_task = asyncio.create_task(relay_messages(room, player))
+
+
+def stop_relay(player: Player):
+    """Stop a player's relay task, dropping anything still queued."""
+    if player.relay_task is not None:
+        player.relay_task.cancel()
+        player.relay_task = None
+
+
+def enqueue(room: GameRoom, player: Player, payload: str):
+    """
+    Queue an encoded message for a player without waiting on the network.
+
+    A player whose queue is full has stopped reading: drop them from the
+    room and close their socket rather than buffer without limit.
+    """
+    if player.send_queue is None:
+        return
+    try:
+        player.send_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        stop_relay(player)
+        remove_player(room, player)
+        asyncio.create_task(player.websocket.close())
+
+
+async def broadcast_to_room(room: GameRoom, message: dict):
+    """
+    Send a message to all players in a room.
+
+    Messages go onto each player's send queue (see relay_messages), so
+    broadcasting never waits for a slow or stalled client.
+    """
+    # Every player gets the same bytes, so serialize once, not per player
+    payload = encode_message(message)
+    players = list(room.players.values())
+    for start in range(0, len(players), BROADCAST_BATCH_SIZE):
+        if start:
+            # Big audience: let other rooms' handlers and timers run
+            await asyncio.sleep(0)
+        for player in players[start:start + BROADCAST_BATCH_SIZE]:
+            enqueue(room, player, payload)
+
+
+async def send_to_player(room: GameRoom, player: Player, message: dict):
     """Send a message to a specific player."""
-    if player.websocket:
-        try:
-            await player.websocket.send_json(message)
-        except:
-            pass
+    enqueue(room, player, encode_message(message))
+
+
+@lru_cache(maxsize=4)
+def category_pool(round_num: int) -> tuple[str, ...]:
+    """
+    Categories that can fill a board for round_num, loaded once per server.
+
+    The database doesn't change while the server runs, so there's no need
+    to re-check it (or copy a ~30K-name list) every time a room starts a
+    round. random.sample() works on the tuple directly.
+    """
+    return tuple(get_usable_categories_cached(db_path=DB_PATH, round_num=round_num))
+
+
+def build_board(round_num: int, values: list[int]):
+    """Pick 6 categories and fill a board for them. Blocking: hits SQLite."""
+    categories = random.sample(category_pool(round_num), 6)
+    # One query for all 30 cells rather than a get_random_clue() per cell
+    board_clues = get_board_clues(categories, values, DB_PATH, round_num=round_num)
+    board = generate_board(
+        categories, lambda cat, val: board_clues.get((cat, val)), values
+    )
+    return categories, board
 
 
-def init_round(room: GameRoom, round_num: int):
+async def init_round(room: GameRoom, round_num: int):
     """Initialize a new round for the room."""
+    if round_num == 1:
+        values = STANDARD_VALUES
+        num_daily_doubles = 1
+    elif round_num == 2:
+        values = DOUBLE_JEOPARDY_VALUES
+        num_daily_doubles = 2
+
+    if round_num in (1, 2):
+        # SQLite queries run in a worker thread so a slow disk doesn't stall
+        # every other room's timers. Fetch first and update the room after,
+        # so nothing sees a half-initialized round while we wait. The room
+        # sits in "loading" meanwhile: other messages are still handled, and
+        # a repeated start_game/start_next_round must not start a second
+        # init_round over this one.
+        previous_phase = room.phase
+        room.phase = "loading"
+        try:
+            categories, board = await asyncio.to_thread(build_board, round_num, values)
+        except BaseException:
+            room.phase = previous_phase
+            raise
+
+    cancel_room_timers(room)  # A restarted game mustn't fire the old one's timers
     room.round_num = round_num
-    room.answered = set()
+    room.answered.clear()
     room.current_clue = None
     room.current_category = None
     room.current_value = None
     room.buzz_open = False
     room.buzzed_player = None
-    room.wrong_buzzers = set()
+    room.wrong_buzzers.clear()
 
     # Board control: host for round 1, lowest score for round 2
     if round_num == 1:
@@ -189,45 +391,83 @@ def init_round(room: GameRoom, round_num: int):
         lowest_player = min(room.players.values(), key=lambda p: p.score)
         room.board_controller = lowest_player.id
 
-    if round_num == 1:
-        room.values = STANDARD_VALUES
-        num_daily_doubles = 1
-    elif round_num == 2:
-        room.values = DOUBLE_JEOPARDY_VALUES
-        num_daily_doubles = 2
-    else:
+    if round_num not in (1, 2):
         return  # Final Jeopardy handled separately
 
-    room.categories = random.sample(get_usable_categories(db_path=DB_PATH, round_num=round_num), 6)
-
-    def get_clue(cat, val):
-        return get_random_clue(cat, val, DB_PATH, round_num=round_num)
-
-    room.board = generate_board(room.categories, get_clue, room.values)
+    room.values = values
+    room.max_board_value = max(values)
+    room.categories = categories
+    room.board = board
 
     # Set daily doubles
-    all_positions = [(cat, val) for cat in room.categories for val in room.values]
-    room.daily_doubles = set(random.sample(all_positions, num_daily_doubles))
+    room.daily_doubles = pick_daily_doubles(
+        room.categories, room.values, num_daily_doubles
+    )
 
     room.phase = "selecting"
 
 
+def reap_idle_rooms(now: float = None) -> int:
+    """
+    Drop rooms that have sat idle past ROOM_IDLE_TIMEOUT.
+
+    Only finished games and rooms nobody is connected to are reaped, so a
+    quiet lobby with players still in it is left alone.
+
+    Returns:
+        Number of rooms removed
+    """
+    if now is None:
+        now = time.monotonic()
+    stale = [
+        room for room in rooms.values()
+        if now - room.last_activity > ROOM_IDLE_TIMEOUT
+        and (
+            room.phase == "game_over"
+            or all(p.websocket is None for p in room.players.values())
+        )
+    ]
+    for room in stale:
+        del rooms[room.room_id]
+        cancel_room_timers(room)
+        for player in room.players.values():
+            stop_relay(player)
+            if player.websocket is not None:
+                asyncio.create_task(player.websocket.close())
+    return len(stale)
+
+
+async def room_reaper():
+    """Periodically reap idle rooms for as long as the server runs."""
+    while True:
+        await asyncio.sleep(ROOM_REAP_INTERVAL)
+        reap_idle_rooms()
+
+
 # FastAPI app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("Multiplayer Jeopardy server starting...")
+    if DB_PATH.exists():
+        create_indexes(DB_PATH)  # No-op once they exist
+    reaper = asyncio.create_task(room_reaper())
     yield
     # Shutdown
+    reaper.cancel()
     print("Multiplayer Jeopardy server shutting down...")
 
 app = FastAPI(lifespan=lifespan)
 
 
+# The page is static, so read it once rather than from disk on every load
+HOME_HTML = (Path(__file__).parent / "multiplayer.html").read_text()
+
+
 @app.get("/")
 async def get_home():
     """Serve the multiplayer game page."""
-    return HTMLResponse(content=open(Path(__file__).parent / "multiplayer.html").read())
+    return HTMLResponse(content=HOME_HTML)
 
 
 @app.websocket("/ws/{room_id}/{player_id}")
@@ -236,7 +476,9 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: str)
 
     # Validate room exists
     if room_id not in rooms:
-        await websocket.send_json({"type": "error", "message": "Room not found"})
+        await websocket.send_text(
+            encode_message({"type": "error", "message": "Room not found"})
+        )
         await websocket.close()
         return
 
@@ -245,14 +487,16 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: str)
     # Check if this is an existing player reconnecting or new player
     if player_id in room.players:
         player = room.players[player_id]
-        player.websocket = websocket
+        start_relay(room, player, websocket)
     else:
-        await websocket.send_json({"type": "error", "message": "Player not in room"})
+        await websocket.send_text(
+            encode_message({"type": "error", "message": "Player not in room"})
+        )
         await websocket.close()
         return
 
     # Send current game state
-    await send_to_player(player, {
+    await send_to_player(room, player, {
         "type": "game_state",
         "state": room.to_dict(),
         "your_id": player_id
@@ -266,21 +510,30 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, player_id: str)
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = decode_message(await websocket.receive_text())
             try:
                 await handle_message(room, player, data)
             except Exception as e:
                 print(f"Error handling message: {e}")
                 import traceback
                 traceback.print_exc()
-                await send_to_player(player, {"type": "error", "message": f"Server error: {str(e)}"})
+                await send_to_player(
+                    room,
+                    player,
+                    {"type": "error", "message": f"Server error: {str(e)}"},
+                )
     except WebSocketDisconnect:
-        # Player disconnected
+        # Player disconnected (unless they've already reconnected elsewhere)
+        if player.websocket is websocket:
+            remove_player(room, player)
         await broadcast_to_room(room, {
             "type": "player_left",
             "player_id": player_id,
             "player_name": player.name
         })
+    finally:
+        if player.websocket is websocket:
+            stop_relay(player)
 
 
 @app.post("/create_room")
@@ -322,16 +575,21 @@ async def join_room(room_id: str, player_name: str = "Player"):
 async def handle_message(room: GameRoom, player: Player, data: dict):
     """Handle incoming WebSocket messages."""
     msg_type = data.get("type")
+    room.last_activity = time.monotonic()
 
     if msg_type == "start_game":
         # Only host can start
         if player.id != room.host_id:
             return
+        if room.phase == "loading":
+            return  # Already starting
         if len(room.players) < 2:
-            await send_to_player(player, {"type": "error", "message": "Need at least 2 players"})
+            await send_to_player(
+                room, player, {"type": "error", "message": "Need at least 2 players"}
+            )
             return
 
-        init_round(room, 1)
+        await init_round(room, 1)
         await broadcast_to_room(room, {
             "type": "game_started",
             "state": room.to_dict()
@@ -350,14 +608,15 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
         if (category, value) in room.answered:
             return
 
-        clue_data = room.board[category][value]["clue"]
+        clue_data = room.board[category, value]["clue"]
         room.current_clue = clue_data
+        room.current_answer_norm = normalize_answer(clue_data["answer"])
         room.current_category = category
         room.current_value = value
-        room.wrong_buzzers = set()
+        room.wrong_buzzers.clear()
         room.buzzed_player = None
         room.phase = "showing_clue"
-        room.clue_shown_time = time.time()
+        room.clue_shown_time = time.monotonic()
 
         # Check for daily double
         is_dd = (category, value) in room.daily_doubles
@@ -383,8 +642,11 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
 
             # Calculate max wager
             player_obj = room.players[player.id]
-            max_board_value = max(room.values)
-            max_wager = max(player_obj.score, max_board_value) if player_obj.score > 0 else max_board_value
+            max_wager = (
+                max(player_obj.score, room.max_board_value)
+                if player_obj.score > 0
+                else room.max_board_value
+            )
             min_wager = 5
 
             await broadcast_to_room(room, {
@@ -407,8 +669,11 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
 
         wager = data.get("wager", 0)
         player_obj = room.players[player.id]
-        max_board_value = max(room.values)
-        max_wager = max(player_obj.score, max_board_value) if player_obj.score > 0 else max_board_value
+        max_wager = (
+            max(player_obj.score, room.max_board_value)
+            if player_obj.score > 0
+            else room.max_board_value
+        )
         min_wager = 5
 
         # Validate wager
@@ -420,9 +685,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
         room.dd_wager = wager
         room.phase = "answering"
         room.buzzed_player = player.id
-        room.answer_deadline = time.time() + ANSWER_TIME
-        room.answer_timer_id += 1
-        current_timer_id = room.answer_timer_id
+        room.answer_deadline = time.monotonic() + ANSWER_TIME
 
         # Now show the clue
         await broadcast_to_room(room, {
@@ -437,7 +700,8 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
         })
 
         # Start answer timeout
-        asyncio.create_task(dd_answer_timeout(room, current_timer_id))
+        cancel_timer(room.answer_task)
+        room.answer_task = asyncio.create_task(dd_answer_timeout(room))
 
     elif msg_type == "buzz":
         if room.phase != "buzz_open":
@@ -447,10 +711,11 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
 
         # First valid buzz wins
         if room.buzzed_player is None:
+            cancel_timer(room.buzz_task)
             room.buzzed_player = player.id
-            room.buzz_time = time.time()
+            room.buzz_time = time.monotonic()
             room.phase = "answering"
-            room.answer_deadline = time.time() + ANSWER_TIME
+            room.answer_deadline = time.monotonic() + ANSWER_TIME
 
             await broadcast_to_room(room, {
                 "type": "player_buzzed",
@@ -466,10 +731,10 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
             return
 
         # Cancel any pending answer timeout
-        room.answer_timer_id += 1
+        cancel_timer(room.answer_task)
 
         answer = data.get("answer", "")
-        correct = check_answer(answer, room.current_clue["answer"])
+        correct = check_normalized_answer(answer, room.current_answer_norm)
 
         # Use dd_wager for Daily Doubles, otherwise use clue value
         is_daily_double = room.dd_player is not None
@@ -490,7 +755,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
                 "correct_answer": room.current_clue["answer"],
                 "value": value,
                 "is_daily_double": is_daily_double,
-                "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+                "scores": room.player_dicts(),
                 "new_board_controller": player.id
             })
 
@@ -515,7 +780,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
                     "correct_answer": room.current_clue["answer"],
                     "value": value,
                     "is_daily_double": True,
-                    "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+                    "scores": room.player_dicts(),
                     "no_more_buzzers": True
                 })
                 # Reset DD state
@@ -532,8 +797,6 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
 
             if eligible:
                 room.phase = "buzz_open"
-                room.buzz_timer_id += 1  # New timer ID cancels old timer
-                current_timer_id = room.buzz_timer_id
                 await broadcast_to_room(room, {
                     "type": "answer_result",
                     "correct": False,
@@ -541,12 +804,15 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
                     "player_name": player.name,
                     "answer": answer,
                     "value": value,
-                    "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+                    "scores": room.player_dicts(),
                     "buzz_reopened": True,
                     "buzz_time": BUZZ_WINDOW_TIME,
                     "wrong_buzzers": list(room.wrong_buzzers)
                 })
-                asyncio.create_task(close_buzzer_after_delay(room, BUZZ_WINDOW_TIME, current_timer_id))
+                cancel_timer(room.buzz_task)
+                room.buzz_task = asyncio.create_task(
+                    close_buzzer_after_delay(room, BUZZ_WINDOW_TIME)
+                )
             else:
                 # Everyone got it wrong, show answer
                 room.answered.add((room.current_category, room.current_value))
@@ -558,7 +824,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
                     "answer": answer,
                     "correct_answer": room.current_clue["answer"],
                     "value": value,
-                    "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+                    "scores": room.player_dicts(),
                     "no_more_buzzers": True
                 })
                 await check_round_complete(room)
@@ -573,7 +839,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
         room.current_category = None
         room.current_value = None
         room.buzzed_player = None
-        room.wrong_buzzers = set()
+        room.wrong_buzzers.clear()
 
         await broadcast_to_room(room, {
             "type": "ready_for_selection",
@@ -587,7 +853,7 @@ async def handle_message(room: GameRoom, player: Player, data: dict):
         if room.phase != "round_end":
             return
 
-        init_round(room, 2)
+        await init_round(room, 2)
         await broadcast_to_room(room, {
             "type": "round_started",
             "round_num": 2,
@@ -658,8 +924,6 @@ async def open_buzzer_after_delay(room: GameRoom):
     if room.phase == "showing_clue":
         room.phase = "buzz_open"
         room.buzz_open = True
-        room.buzz_timer_id += 1  # New timer ID
-        current_timer_id = room.buzz_timer_id
 
         await broadcast_to_room(room, {
             "type": "buzz_open",
@@ -667,16 +931,32 @@ async def open_buzzer_after_delay(room: GameRoom):
         })
 
         # Start timer to close buzzer if no one buzzes
-        asyncio.create_task(close_buzzer_after_delay(room, BUZZ_WINDOW_TIME, current_timer_id))
+        cancel_timer(room.buzz_task)
+        room.buzz_task = asyncio.create_task(
+            close_buzzer_after_delay(room, BUZZ_WINDOW_TIME)
+        )
+
 
+def cancel_timer(task: asyncio.Task | None):
+    """Cancel a room timer task that is still sleeping."""
+    if task is not None and not task.done():
+        task.cancel()
 
-async def close_buzzer_after_delay(room: GameRoom, delay: float, timer_id: int):
+
+def cancel_room_timers(room: GameRoom):
+    """Cancel every pending timer in the room (reset or reaped)."""
+    timers = (room.buzz_task, room.answer_task, room.fj_wager_task, room.fj_answer_task)
+    for task in timers:
+        cancel_timer(task)
+    room.buzz_task = room.answer_task = room.fj_wager_task = room.fj_answer_task = None
+
+
+async def close_buzzer_after_delay(room: GameRoom, delay: float):
     """Close the buzzer after timeout."""
+    # A newer buzz window cancels this task while it sleeps
     await asyncio.sleep(delay)
-
-    # Only close if this timer is still the active one
-    if room.buzz_timer_id != timer_id:
-        return  # A newer timer has been started, ignore this one
+    # From here on the timer has fired, so nothing should cancel it mid-broadcast
+    room.buzz_task = None
 
     if room.phase == "buzz_open" and room.buzzed_player is None:
         room.phase = "showing_answer"
@@ -691,13 +971,11 @@ async def close_buzzer_after_delay(room: GameRoom, delay: float, timer_id: int):
         await check_round_complete(room)
 
 
-async def dd_answer_timeout(room: GameRoom, timer_id: int):
+async def dd_answer_timeout(room: GameRoom):
     """Handle timeout for Daily Double answer."""
+    # Submitting the answer cancels this task while it sleeps
     await asyncio.sleep(ANSWER_TIME)
-
-    # Only process if this timer is still the active one
-    if room.answer_timer_id != timer_id:
-        return  # A newer timer has been started, ignore this one
+    room.answer_task = None
 
     if room.phase != "answering":
         return  # Already answered
@@ -719,7 +997,7 @@ async def dd_answer_timeout(room: GameRoom, timer_id: int):
         "correct_answer": room.current_clue["answer"],
         "value": room.dd_wager,
         "is_daily_double": True,
-        "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+        "scores": room.player_dicts(),
         "no_more_buzzers": True,
         "timeout": True
     })
@@ -743,7 +1021,7 @@ async def check_round_complete(room: GameRoom):
                 "type": "round_complete",
                 "round": 1,
                 "next_round": 2,
-                "scores": {pid: p.to_dict() for pid, p in room.players.items()}
+                "scores": room.player_dicts()
             })
         elif room.round_num == 2:
             # Start Final Jeopardy
@@ -755,14 +1033,17 @@ async def check_round_complete(room: GameRoom):
 async def start_final_jeopardy(room: GameRoom):
     """Initialize and start Final Jeopardy."""
     room.round_num = 3
-    room.current_clue = get_final_jeopardy_clue(DB_PATH)
+    room.current_clue = await asyncio.to_thread(get_final_jeopardy_clue, DB_PATH)
+    room.current_answer_norm = (
+        normalize_answer(room.current_clue["answer"]) if room.current_clue else None
+    )
 
     # Find eligible players (positive scores)
     room.fj_eligible_players = {pid for pid, p in room.players.items() if p.score > 0}
-    room.fj_wagers = {}
-    room.fj_answers = {}
-    room.fj_wagers_received = set()
-    room.fj_answers_received = set()
+    room.fj_wagers.clear()
+    room.fj_answers.clear()
+    room.fj_wagers_received.clear()
+    room.fj_answers_received.clear()
 
     if not room.fj_eligible_players:
         # No one has positive score - game over
@@ -770,7 +1051,7 @@ async def start_final_jeopardy(room: GameRoom):
         await broadcast_to_room(room, {
             "type": "game_over",
             "reason": "No players have positive scores for Final Jeopardy",
-            "scores": {pid: p.to_dict() for pid, p in room.players.items()}
+            "scores": room.player_dicts()
         })
         return
 
@@ -781,17 +1062,20 @@ async def start_final_jeopardy(room: GameRoom):
         "type": "fj_start_wager",
         "category": room.current_clue["category"],
         "eligible_players": list(room.fj_eligible_players),
-        "scores": {pid: p.to_dict() for pid, p in room.players.items()},
+        "scores": room.player_dicts(),
         "wager_time": FJ_WAGER_TIME
     })
 
     # Start wager timeout
-    asyncio.create_task(fj_wager_timeout(room))
+    cancel_timer(room.fj_wager_task)
+    room.fj_wager_task = asyncio.create_task(fj_wager_timeout(room))
 
 
 async def fj_wager_timeout(room: GameRoom):
     """Handle timeout for Final Jeopardy wagering."""
+    # The last wager coming in cancels this task while it sleeps
     await asyncio.sleep(FJ_WAGER_TIME)
+    room.fj_wager_task = None
 
     if room.phase != "fj_wagering":
         return  # Already moved on
@@ -807,6 +1091,8 @@ async def fj_wager_timeout(room: GameRoom):
 
 async def start_fj_clue_phase(room: GameRoom):
     """Show the Final Jeopardy clue and start answer timer."""
+    cancel_timer(room.fj_wager_task)  # All wagers may be in before it fires
+    room.fj_wager_task = None
     room.phase = "fj_answering"
 
     await broadcast_to_room(room, {
@@ -818,12 +1104,15 @@ async def start_fj_clue_phase(room: GameRoom):
     })
 
     # Start answer timeout
-    asyncio.create_task(fj_answer_timeout(room))
+    cancel_timer(room.fj_answer_task)
+    room.fj_answer_task = asyncio.create_task(fj_answer_timeout(room))
 
 
 async def fj_answer_timeout(room: GameRoom):
     """Handle timeout for Final Jeopardy answering."""
+    # The last answer coming in cancels this task while it sleeps
     await asyncio.sleep(FJ_ANSWER_TIME)
+    room.fj_answer_task = None
 
     if room.phase != "fj_answering":
         return  # Already moved on
@@ -839,6 +1128,8 @@ async def fj_answer_timeout(room: GameRoom):
 
 async def reveal_fj_answers(room: GameRoom):
     """Reveal all Final Jeopardy answers and calculate final scores."""
+    cancel_timer(room.fj_answer_task)  # All answers may be in before it fires
+    room.fj_answer_task = None
     room.phase = "fj_reveal"
 
     results = []
@@ -849,7 +1140,7 @@ async def reveal_fj_answers(room: GameRoom):
         player = room.players[pid]
         answer = room.fj_answers.get(pid, "")
         wager = room.fj_wagers.get(pid, 0)
-        is_correct = check_answer(answer, correct_answer)
+        is_correct = check_normalized_answer(answer, room.current_answer_norm)
 
         if is_correct:
             player.score += wager
@@ -876,10 +1167,16 @@ async def reveal_fj_answers(room: GameRoom):
         "results": results,
         "winner_id": winner.id,
         "winner_name": winner.name,
-        "final_scores": {pid: p.to_dict() for pid, p in room.players.items()}
+        "final_scores": room.player_dicts()
     })
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop comes with uvicorn[standard] everywhere but Windows. Ask for it
+    # by name so a broken install fails loudly instead of quietly falling
+    # back to the slower asyncio loop.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, ws="websockets")
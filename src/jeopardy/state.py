@@ -17,13 +17,104 @@ Why separate state from logic?
 - Can save/load games easily
 """
 
-from dataclasses import dataclass, field, asdict
+from collections.abc import Iterable, Iterator, MutableSet
+from dataclasses import dataclass, field
 from pathlib import Path
+import gzip
 import json
 from typing import Any
 
+# orjson encodes and parses several times faster than the stdlib json
+# module. Both versions work in bytes; orjson's decode error subclasses
+# json.JSONDecodeError, so callers catch the same exception either way.
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-@dataclass
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Saves named *.gz are gzipped. Level 3 is about twice as fast as the
+# default 9 and a save is a few hundred bytes, so the ratio barely moves.
+SAVE_COMPRESSLEVEL = 3
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+# One bit per dollar value, so a category's answered clues fit in one int
+VALUE_BITS = {
+    200: 1 << 0, 400: 1 << 1, 600: 1 << 2, 800: 1 << 3, 1000: 1 << 4,
+    1200: 1 << 5, 1600: 1 << 6, 2000: 1 << 7,
+}
+# The values on a standard-round board, and the mask with all of them answered
+ALL_VALUES = (200, 400, 600, 800, 1000)
+ALL_VALUES_MASK = 0b11111
+_ALL_VALUE_BITS = tuple((value, VALUE_BITS[value]) for value in ALL_VALUES)
+
+
+class AnsweredSet(MutableSet):
+    """
+    Set of answered (category, value) pairs, stored as one bitmask per category.
+
+    Behaves like set[tuple[str, int]] (add, in, len, iteration, ==), but a
+    membership test is a dict lookup plus one AND instead of hashing and
+    comparing a tuple. Only board values (the keys of VALUE_BITS) can be
+    added; anything else raises ValueError.
+
+    Example:
+        >>> answered = AnsweredSet({('SCIENCE', 400)})
+        >>> ('SCIENCE', 400) in answered
+        True
+        >>> answered.masks
+        {'SCIENCE': 2}
+    """
+
+    def __init__(self, items: Iterable[tuple[str, int]] = ()) -> None:
+        self.masks: dict[str, int] = {}
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def from_masks(cls, masks: dict[str, int]) -> "AnsweredSet":
+        """Rebuild a set from the per-category bitmasks in .masks."""
+        answered = cls()
+        answered.masks = {category: mask for category, mask in masks.items() if mask}
+        return answered
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            category, value = item
+            return bool(self.masks.get(category, 0) & VALUE_BITS[value])
+        except (TypeError, ValueError, KeyError):
+            return False
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        for category, mask in self.masks.items():
+            for value, bit in VALUE_BITS.items():
+                if mask & bit:
+                    yield (category, value)
+
+    def __len__(self) -> int:
+        return sum(mask.bit_count() for mask in self.masks.values())
+
+    def __repr__(self) -> str:
+        return f"AnsweredSet({set(self)!r})"
+
+    def add(self, item: tuple[str, int]) -> None:
+        category, value = item
+        bit = VALUE_BITS.get(value)
+        if bit is None:
+            raise ValueError(f"{value!r} is not a board value (see VALUE_BITS)")
+        self.masks[category] = self.masks.get(category, 0) | bit
+
+    def discard(self, item: tuple[str, int]) -> None:
+        if item in self:
+            category, value = item
+            self.masks[category] &= ~VALUE_BITS[value]
+
+
+@dataclass(slots=True)
 class GameState:
     """
     Represents the current state of a Jeopardy game.
@@ -33,6 +124,7 @@ class GameState:
     Attributes:
         score: Current player score (can be negative!)
         answered: Set of (category, value) tuples for clues already answered
+            (an AnsweredSet; plain sets passed in are converted)
         current_clue: The currently active clue being answered, if any
         categories: The 6 categories in this game
         game_over: Whether the game has ended
@@ -52,6 +144,36 @@ class GameState:
     categories: list[str] = field(default_factory=list)
     game_over: bool = False
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.answered, AnsweredSet):
+            self.answered = AnsweredSet(self.answered)
+
+    @property
+    def answered_mask(self) -> dict[str, int]:
+        """Answered values per category as bitmasks (see VALUE_BITS)."""
+        return self.answered.masks
+
+    @property
+    def remaining_per_category(self) -> dict[str, int]:
+        """Number of unanswered clues in each category."""
+        masks = self.answered.masks
+        return {
+            cat: (~masks.get(cat, 0) & ALL_VALUES_MASK).bit_count()
+            for cat in self.categories
+        }
+
+    def mark_answered(self, category: str, value: int) -> None:
+        """
+        Mark a clue as answered without changing the score.
+
+        Used directly when a player passes, and by answer_clue().
+
+        Args:
+            category: Category name
+            value: Dollar value
+        """
+        self.answered.add((category, value))
+
     def select_clue(self, category: str, value: int, clue: dict) -> None:
         """
         Mark a clue as the current active clue.
@@ -73,7 +195,11 @@ class GameState:
         """
         if self.is_answered(category, value):
             raise ValueError("Clue already answered")
-        self.current_clue = {**clue, "category": category, "value": value}
+        # copy() and two stores beat re-merging every key with {**clue, ...}
+        current = clue.copy()
+        current["category"] = category
+        current["value"] = value
+        self.current_clue = current
     
 
     def answer_clue(self, correct: bool, value: int) -> None:
@@ -98,7 +224,7 @@ class GameState:
             self.score += value
         else:
             self.score -= value
-        self.answered.add((self.current_clue['category'], self.current_clue['value']))
+        self.mark_answered(self.current_clue['category'], self.current_clue['value'])
         self.current_clue = None
 
     def is_answered(self, category: str, value: int) -> bool:
@@ -112,7 +238,7 @@ class GameState:
         Returns:
             True if already answered, False if still available
         """
-        return (category, value) in self.answered
+        return bool(self.answered.masks.get(category, 0) & VALUE_BITS.get(value, 0))
 
     def remaining_clues_count(self) -> int:
         """
@@ -123,7 +249,9 @@ class GameState:
         Returns:
             Number of unanswered clues
         """
-        return 30 - len(self.answered)
+        # Counted per category, so answers outside .categories (e.g. a bare
+        # GameState() with answers loaded) can't push it below zero
+        return sum(self.remaining_per_category.values())
 
     def get_available_values(self, category: str) -> list[int]:
         """
@@ -139,15 +267,16 @@ class GameState:
             >>> state.get_available_values('SCIENCE')
             [200, 400, 600, 800, 1000]  # All available at start
         """
-        all_values = [200, 400, 600, 800, 1000]
-        return [value for value in all_values if (category, value) not in self.answered]
+        mask = self.answered.masks.get(category, 0)
+        return [value for value, bit in _ALL_VALUE_BITS if not mask & bit]
 
 
 def state_to_dict(state: GameState) -> dict[str, Any]:
     """
     Convert GameState to a JSON-serializable dictionary.
 
-    Note: Sets aren't JSON serializable, so we convert to lists.
+    Note: Sets aren't JSON serializable, so answered is saved as its
+    per-category bitmasks (see VALUE_BITS) under 'answered_mask'.
 
     Args:
         state: GameState to convert
@@ -158,19 +287,28 @@ def state_to_dict(state: GameState) -> dict[str, Any]:
     Example:
         >>> state = GameState(score=400, answered={('SCIENCE', 400)})
         >>> d = state_to_dict(state)
-        >>> d['answered']
-        [['SCIENCE', 400]]  # List of lists, not set of tuples
+        >>> d['answered_mask']
+        {'SCIENCE': 2}  # One int per category, not a set of tuples
     """
-    data = asdict(state)
-    data['answered'] = [list(item) for item in state.answered]
-    return data
+    # Built by hand: asdict() would deep-copy every field just to be dumped.
+    # current_clue and categories are shared with the state, not copied.
+    return {
+        'score': state.score,
+        'answered_mask': dict(state.answered.masks),
+        'current_clue': state.current_clue,
+        'categories': state.categories,
+        'game_over': state.game_over,
+    }
 
 
 def dict_to_state(data: dict[str, Any]) -> GameState:
     """
     Convert dictionary back to GameState.
 
-    Inverse of state_to_dict.
+    Inverse of state_to_dict. Older saves that list answered clues as
+    [category, value] pairs under 'answered' load too; pairs whose value
+    isn't a board value (see VALUE_BITS) can't match any clue and are
+    dropped.
 
     Args:
         data: Dictionary from JSON
@@ -178,7 +316,13 @@ def dict_to_state(data: dict[str, Any]) -> GameState:
     Returns:
         Reconstructed GameState
     """
-    answered_set = set((item[0], item[1]) for item in data['answered'])
+    if 'answered_mask' in data:
+        answered_set = AnsweredSet.from_masks(data['answered_mask'])
+    else:
+        # add() unpacks each [category, value] pair itself, no tuples needed
+        answered_set = AnsweredSet(
+            pair for pair in data['answered'] if pair[1] in VALUE_BITS
+        )
     return GameState(
         score=data['score'],
         answered=answered_set,
@@ -190,7 +334,7 @@ def dict_to_state(data: dict[str, Any]) -> GameState:
 
 def save_game(state: GameState, filepath: Path) -> None:
     """
-    Save game state to a JSON file.
+    Save game state to a JSON file, gzipped if the name ends in .gz.
 
     Args:
         state: Current game state
@@ -198,17 +342,20 @@ def save_game(state: GameState, filepath: Path) -> None:
 
     Example:
         >>> save_game(state, Path('saved_game.json'))
+        >>> save_game(state, Path('saved_game.json.gz'))  # Compressed
 
-    Hint: Use state_to_dict() then json.dump()
+    Hint: Use state_to_dict() then json_dumps()
     """
-    state_to_dict(state)
-    with open(filepath, 'w') as f:
-        json.dump(state_to_dict(state), f)
+    data = json_dumps(state_to_dict(state))
+    if Path(filepath).suffix == '.gz':
+        data = gzip.compress(data, compresslevel=SAVE_COMPRESSLEVEL)
+    with open(filepath, 'wb') as f:
+        f.write(data)
 
 
 def load_game(filepath: Path) -> GameState:
     """
-    Load game state from a JSON file.
+    Load game state from a JSON file, gzipped or not.
 
     Args:
         filepath: Path to saved game
@@ -225,9 +372,12 @@ def load_game(filepath: Path) -> GameState:
         >>> state.score
         1200
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    return dict_to_state(data)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    # Sniff rather than trust the name, so a renamed save still loads
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return dict_to_state(json_loads(raw))
 
 
 def create_new_game(categories: list[str]) -> GameState:
@@ -1,16 +1,33 @@
 import streamlit as st
 from pathlib import Path
+import os
 import random
-import gzip
-import shutil
 
-from jeopardy.database import get_usable_categories, get_random_clue, create_database, load_clues_to_db, get_final_jeopardy_clue
-from jeopardy.data import load_tsv_data, clean_clues
-from jeopardy.game import STANDARD_VALUES, DOUBLE_JEOPARDY_VALUES, check_answer, generate_board
-from jeopardy.state import create_new_game
+from jeopardy.database import (
+    create_database,
+    create_indexes,
+    get_board_clues,
+    get_connection,
+    get_final_jeopardy_clue,
+    get_usable_categories_cached,
+    load_clues_to_db,
+)
+from jeopardy.game import (
+    DOUBLE_JEOPARDY_VALUES,
+    STANDARD_VALUES,
+    check_answer,
+    generate_board,
+    pick_daily_doubles,
+)
+from jeopardy.state import VALUE_BITS, AnsweredSet, create_new_game
 
 DB_PATH = Path("jeopardy.db")
 DB_GZ_PATH = Path("jeopardy.db.gz")
+# copyfileobj's default 64 KiB chunks mean thousands of syscalls for the
+# database; 1 MiB chunks cut that by 16x
+DECOMPRESS_CHUNK_SIZE = 1 << 20
+# Drops "$" and "," from typed wagers in one pass ("$1,000" -> "1000")
+_WAGER_STRIP = str.maketrans("", "", "$,")
 
 
 def init_database():
@@ -19,19 +36,42 @@ def init_database():
         # First, try to decompress from .gz file (for cloud deployment)
         if DB_GZ_PATH.exists():
             st.info("Decompressing database for first run...")
+            # First-run-only imports stay out of every later cold start
+            import gzip
+            import shutil
+
+            # Decompress beside the target and rename into place, so a run
+            # killed halfway can't leave a truncated jeopardy.db behind
+            tmp_path = DB_PATH.with_name(DB_PATH.name + ".tmp")
             with gzip.open(DB_GZ_PATH, 'rb') as f_in:
-                with open(DB_PATH, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                with open(tmp_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out, DECOMPRESS_CHUNK_SIZE)
+            os.replace(tmp_path, DB_PATH)
+            # The shipped database predates our indexes
+            create_indexes(DB_PATH)
             st.rerun()
         else:
             # Fall back to building from TSV (for local development)
             st.info("Setting up database for first run... this may take a moment.")
+            from jeopardy.data import load_clean_tsv_data
+
             create_database(DB_PATH)
-            clues = clean_clues(load_tsv_data())
+            clues = load_clean_tsv_data()
             load_clues_to_db(clues, DB_PATH)
             st.rerun()
 
 
+@st.cache_resource
+def db_connection():
+    """
+    One read-only connection shared by every session and rerun.
+
+    Each rerun runs on a new thread, so database's per-thread cache would
+    otherwise reopen the file (and re-warm its page cache) on every click.
+    """
+    return get_connection(DB_PATH, read_only=True, check_same_thread=False)
+
+
 def init_round(round_num: int):
     """Initialize a new round (1 = Jeopardy, 2 = Double Jeopardy)."""
     if round_num == 1:
@@ -41,16 +81,19 @@ def init_round(round_num: int):
         values = DOUBLE_JEOPARDY_VALUES
         num_daily_doubles = 2
 
-    categories = random.sample(get_usable_categories(db_path=DB_PATH, round_num=round_num), 6)
-
-    def get_clue(cat, val):
-        return get_random_clue(cat, val, DB_PATH, round_num=round_num)
+    usable = get_usable_categories_cached(db_path=DB_PATH, round_num=round_num)
+    categories = random.sample(usable, 6)
 
-    board = generate_board(categories, get_clue, values)
+    # One query for all 30 cells rather than a get_random_clue() per cell
+    board_clues = get_board_clues(
+        categories, values, db_connection(), round_num=round_num
+    )
+    board = generate_board(
+        categories, lambda cat, val: board_clues.get((cat, val)), values
+    )
 
     # Randomly select Daily Double positions
-    all_positions = [(cat, val) for cat in categories for val in values]
-    daily_doubles = set(random.sample(all_positions, num_daily_doubles))
+    daily_doubles = pick_daily_doubles(categories, values, num_daily_doubles)
 
     return categories, board, values, daily_doubles
 
@@ -63,8 +106,7 @@ def main():
     with st.sidebar:
         st.write("Game Controls")
         if st.button("New Game"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             st.rerun()
 
         st.write("---")
@@ -72,11 +114,10 @@ def main():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("Double", help="Skip to Double Jeopardy"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                st.session_state.clear()
                 st.session_state.round_num = 2
                 st.session_state.score = 0
-                st.session_state.answered = set()
+                st.session_state.answered = AnsweredSet()
                 categories, board, values, daily_doubles = init_round(2)
                 st.session_state.categories = categories
                 st.session_state.board = board
@@ -85,16 +126,15 @@ def main():
                 st.rerun()
         with col2:
             if st.button("Final", help="Skip to Final Jeopardy"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                st.session_state.clear()
                 st.session_state.round_num = 3
                 st.session_state.score = 5  # $5 so you can wager something
                 st.session_state.values = []  # Prevents reset to round 1
-                st.session_state.answered = set()
+                st.session_state.answered = AnsweredSet()
                 st.session_state.categories = []
                 st.session_state.board = {}
                 st.session_state.daily_doubles = set()
-                st.session_state.fj_clue = get_final_jeopardy_clue(DB_PATH)
+                st.session_state.fj_clue = get_final_jeopardy_clue(db_connection())
                 st.session_state.fj_stage = "wager"
                 st.rerun()
 
@@ -109,7 +149,7 @@ def main():
     if "round_num" not in st.session_state or "values" not in st.session_state:
         st.session_state.round_num = 1
         st.session_state.score = 0
-        st.session_state.answered = set()
+        st.session_state.answered = AnsweredSet()
         categories, board, values, daily_doubles = init_round(1)
         st.session_state.categories = categories
         st.session_state.board = board
@@ -132,7 +172,7 @@ def main():
             st.success("Round 1 Complete! Moving to Double Jeopardy!")
             if st.button("Start Double Jeopardy"):
                 st.session_state.round_num = 2
-                st.session_state.answered = set()
+                st.session_state.answered = AnsweredSet()
                 categories, board, values, daily_doubles = init_round(2)
                 st.session_state.categories = categories
                 st.session_state.board = board
@@ -147,15 +187,14 @@ def main():
                 st.header("Game Over!")
                 st.subheader(f"Final Score: ${score:,}")
                 if st.button("Play Again"):
-                    for key in list(st.session_state.keys()):
-                        del st.session_state[key]
+                    st.session_state.clear()
                     st.rerun()
                 return
             else:
                 st.success("Double Jeopardy Complete! Time for Final Jeopardy!")
                 if st.button("Start Final Jeopardy"):
                     st.session_state.round_num = 3
-                    st.session_state.fj_clue = get_final_jeopardy_clue(DB_PATH)
+                    st.session_state.fj_clue = get_final_jeopardy_clue(db_connection())
                     st.session_state.fj_stage = "wager"
                     st.rerun()
                 return
@@ -175,7 +214,7 @@ def main():
 
             # Validate wager
             try:
-                wager = int(wager_input.replace(",", "").replace("$", ""))
+                wager = int(wager_input.translate(_WAGER_STRIP))
                 if wager < 0:
                     st.error("Wager must be at least $0")
                     wager = None
@@ -228,8 +267,7 @@ def main():
             st.header("Game Over!")
             st.subheader(f"Final Score: ${st.session_state.score:,}")
             if st.button("Play Again"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                st.session_state.clear()
                 st.rerun()
         return
 
@@ -251,21 +289,30 @@ def main():
         del st.session_state.last_result
 
     # Display board as buttons
+    # answered keeps one bitmask per category, so each button is a bit test
     cols = st.columns(6)
     for i, cat in enumerate(categories):
+        mask = answered.masks.get(cat, 0)
         with cols[i]:
-            st.write(f"**{cat}**")
+            # Runs of plain text (the header, answered cells) go out as one
+            # markdown element; only unanswered cells need their own widget
+            text = [f"**{cat}**"]
             for value in values:
-                if (cat, value) not in answered:
+                if not mask & VALUE_BITS[value]:
+                    if text:
+                        st.markdown("  \n".join(text))
+                        text = []
                     if st.button(f"${value}", key=f"{cat}-{value}"):
                         st.session_state.selected = (cat, value)
                 else:
-                    st.write("-")
+                    text.append("\\-")  # Escaped, or a lone "-" starts a list
+            if text:
+                st.markdown("  \n".join(text))
 
     # Handle clue selection
     if "selected" in st.session_state:
         cat, val = st.session_state.selected
-        clue = board[cat][val]["clue"]
+        clue = board[cat, val]["clue"]
         is_daily_double = (cat, val) in daily_doubles
 
         # Daily Double wagering
@@ -284,7 +331,7 @@ def main():
             wager_input = st.text_input("Your wager:", value=str(min_wager), key=f"dd_wager_{cat}_{val}")
 
             try:
-                wager = int(wager_input.replace(",", "").replace("$", ""))
+                wager = int(wager_input.translate(_WAGER_STRIP))
                 if wager < min_wager:
                     st.error(f"Minimum wager is ${min_wager}")
                     wager = None
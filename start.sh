@@ -21,4 +21,4 @@ echo "Checking database tables..."
 sqlite3 jeopardy.db ".tables" || echo "Failed to read database"
 
 export PYTHONPATH=src
-uvicorn jeopardy.multiplayer:app --host 0.0.0.0 --port $PORT
+uvicorn jeopardy.multiplayer:app --host 0.0.0.0 --port $PORT --loop uvloop --ws websockets
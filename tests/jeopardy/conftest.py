@@ -5,14 +5,83 @@ Fixtures are reusable test setup. This file is automatically
 loaded by pytest - you don't need to import it.
 
 Learn more about fixtures: https://docs.pytest.org/en/stable/fixture.html
+
+Every database fixture lives under tmp_path / tmp_path_factory, so the
+suite is safe to spread over cores with pytest-xdist when it gets big
+enough to need it: `pytest -n auto --dist loadfile` keeps each module on
+one worker, and each worker builds its own populated_db template.
 """
 
 import pytest
+from collections import Counter
 from pathlib import Path
+import random
+import shutil
 import tempfile
 import json
 
 
+@pytest.fixture(autouse=True)
+def seeded_random():
+    """
+    Seed the random module before every test.
+
+    get_random_clue, get_final_jeopardy_clue and pick_daily_doubles pick
+    with random, so a failure always reproduces with the same picks.
+    """
+    random.seed(0)
+
+
+# Shared by the sample_clues fixture and the populated database template
+SAMPLE_CLUES = [
+    {
+        "category": "SCIENCE",
+        "value": 200,
+        "question": "This planet is known as the Red Planet",
+        "answer": "Mars",
+        "round": "Jeopardy!",
+        "show_number": 1000,
+        "air_date": "2020-01-01"
+    },
+    {
+        "category": "SCIENCE",
+        "value": 400,
+        "question": "The chemical symbol for gold",
+        "answer": "Au",
+        "round": "Jeopardy!",
+        "show_number": 1000,
+        "air_date": "2020-01-01"
+    },
+    {
+        "category": "SCIENCE",
+        "value": 600,
+        "question": "This force keeps planets in orbit",
+        "answer": "Gravity",
+        "round": "Jeopardy!",
+        "show_number": 1000,
+        "air_date": "2020-01-01"
+    },
+    {
+        "category": "HISTORY",
+        "value": 200,
+        "question": "The first President of the United States",
+        "answer": "George Washington",
+        "round": "Jeopardy!",
+        "show_number": 1000,
+        "air_date": "2020-01-01"
+    },
+    {
+        "category": "HISTORY",
+        "value": 400,
+        "question": "This document was signed in 1776",
+        "answer": "The Declaration of Independence",
+        "round": "Jeopardy!",
+        "show_number": 1000,
+        "air_date": "2020-01-01"
+    },
+]
+
+
 @pytest.fixture
 def sample_clues() -> list[dict]:
     """
@@ -24,53 +93,27 @@ def sample_clues() -> list[dict]:
         def test_something(sample_clues):
             assert len(sample_clues) == 5
     """
-    return [
-        {
-            "category": "SCIENCE",
-            "value": 200,
-            "question": "This planet is known as the Red Planet",
-            "answer": "Mars",
-            "round": "Jeopardy!",
-            "show_number": 1000,
-            "air_date": "2020-01-01"
-        },
-        {
-            "category": "SCIENCE",
-            "value": 400,
-            "question": "The chemical symbol for gold",
-            "answer": "Au",
-            "round": "Jeopardy!",
-            "show_number": 1000,
-            "air_date": "2020-01-01"
-        },
-        {
-            "category": "SCIENCE",
-            "value": 600,
-            "question": "This force keeps planets in orbit",
-            "answer": "Gravity",
-            "round": "Jeopardy!",
-            "show_number": 1000,
-            "air_date": "2020-01-01"
-        },
-        {
-            "category": "HISTORY",
-            "value": 200,
-            "question": "The first President of the United States",
-            "answer": "George Washington",
-            "round": "Jeopardy!",
-            "show_number": 1000,
-            "air_date": "2020-01-01"
-        },
-        {
-            "category": "HISTORY",
-            "value": 400,
-            "question": "This document was signed in 1776",
-            "answer": "The Declaration of Independence",
-            "round": "Jeopardy!",
-            "show_number": 1000,
-            "air_date": "2020-01-01"
-        },
-    ]
+    return [dict(clue) for clue in SAMPLE_CLUES]
+
+
+@pytest.fixture(scope="session")
+def sample_clue_count() -> int:
+    """len(SAMPLE_CLUES), for tests that only check how many clues there are."""
+    return len(SAMPLE_CLUES)
+
+
+@pytest.fixture(scope="session")
+def expected_category_counts() -> dict[str, int]:
+    """Clues per category in SAMPLE_CLUES (and so in populated_db)."""
+    return dict(Counter(clue["category"] for clue in SAMPLE_CLUES))
+
+
+@pytest.fixture
+def clues_by_category(sample_clues) -> dict[str, list[dict]]:
+    """sample_clues grouped by category, built once per test."""
+    from jeopardy.data import group_by_category
+
+    return group_by_category(sample_clues)
 
 
 @pytest.fixture
@@ -119,6 +162,18 @@ def temp_db(tmp_path) -> Path:
     return tmp_path / "test_jeopardy.db"
 
 
+@pytest.fixture(scope="session")
+def save_dir(tmp_path_factory) -> Path:
+    """One directory for every saved-game test in the session."""
+    return tmp_path_factory.mktemp("saves")
+
+
+@pytest.fixture
+def save_path(save_dir, request) -> Path:
+    """A save file path unique to this test, inside save_dir (not yet written)."""
+    return save_dir / f"{request.node.name}.json"
+
+
 @pytest.fixture
 def temp_json_file(tmp_path, sample_clues) -> Path:
     """
@@ -132,15 +187,90 @@ def temp_json_file(tmp_path, sample_clues) -> Path:
 
 
 @pytest.fixture
-def populated_db(temp_db, sample_clues):
+def temp_tsv_file(tmp_path) -> Path:
     """
-    A database with sample clues already loaded.
+    Create a temporary TSV file in the raw clues.tsv format.
+
+    Includes a pre-2001 row (value gets doubled), an empty value, a date
+    with stray whitespace (kept), and malformed rows (bad dates, a
+    non-numeric value) that should be skipped.
+    """
+    rows = [
+        [
+            "round", "clue_value", "daily_double_value", "category", "comments",
+            "answer", "question", "air_date", "notes",
+        ],
+        [
+            "1", "100", "0", " science ", "", "This planet is red", "Mars",
+            "1990-05-01", "",
+        ],
+        [
+            "1", "400", "0", "HISTORY", "", " First president ", "George Washington",
+            "2010-01-04", "",
+        ],
+        ["3", "", "0", "WORDS", "", "A final clue", "Final", "2015-03-02", ""],
+        ["2", "800", "0", "SPORTS", "", "Bad date", "Nope", "not-a-date", ""],
+        ["2", "abc", "0", "SPORTS", "", "Bad value", "Nope", "2015-03-02", ""],
+        ["2", "800", "0", "SPORTS", "", "No dashes", "Nope", "20100104", ""],
+        ["2", "800", "0", "SPORTS", "", "No such day", "Nope", "2010-02-30", ""],
+        ["2", "800", "0", "SPORTS", "", "Short month", "Nope", "2010-1-04", ""],
+        ["2", "1200", "0", "straße", "", "Padded date", "Kept", " 2010-01-04", ""],
+    ]
+    filepath = tmp_path / "clues.tsv"
+    lines = ["\t".join(row) for row in rows]
+    filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return filepath
+
+
+@pytest.fixture(scope="session")
+def populated_db_template(tmp_path_factory) -> Path:
+    """
+    A database with SAMPLE_CLUES loaded, built once per test session.
 
-    Use this when testing query functions.
+    Don't use this directly - tests get their own copy via populated_db.
     """
     # Import here to avoid circular imports
-    from jeopardy.database import create_database, load_clues_to_db
+    from jeopardy.database import (
+        close_connections,
+        create_database,
+        load_clues_to_db,
+    )
+
+    db_path = tmp_path_factory.mktemp("template") / "test_jeopardy.db"
+    create_database(db_path)
+    load_clues_to_db(SAMPLE_CLUES, db_path)
+    # Closing the last connection checkpoints the WAL into the main file
+    close_connections()
+    return db_path
+
+
+@pytest.fixture
+def populated_db(temp_db, populated_db_template):
+    """
+    A database with sample clues already loaded.
 
-    create_database(temp_db)
-    load_clues_to_db(sample_clues, temp_db)
+    Use this when testing query functions. Each test gets a fresh copy of
+    a template built once per session, so tests may modify it freely
+    without paying for the schema and inserts every time.
+    """
+    shutil.copyfile(populated_db_template, temp_db)
     return temp_db
+
+
+@pytest.fixture
+def memory_db():
+    """
+    An in-memory database connection with sample clues loaded.
+
+    For tests of query functions that accept a connection in place of a
+    path: no file, no journal, no fsync. Functions that cache on the
+    database file's stat (counts, get_usable_categories_cached) still
+    need populated_db.
+    """
+    from jeopardy.database import create_database, get_connection, load_clues_to_db
+
+    conn = get_connection(":memory:")
+    create_database(conn)
+    load_clues_to_db(SAMPLE_CLUES, conn)
+    yield conn
+    conn.close()
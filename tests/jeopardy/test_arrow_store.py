@@ -0,0 +1,115 @@
+"""
+Tests for jeopardy.arrow_store module.
+
+These need pyarrow, so the whole module is skipped without it.
+
+Run with: uv run pytest tests/jeopardy/test_arrow_store.py -v
+"""
+
+import pytest
+
+from jeopardy.data import clean_clue_table
+
+pa = pytest.importorskip("pyarrow")
+arrow_store = pytest.importorskip("jeopardy.arrow_store")
+
+
+@pytest.fixture
+def clue_table(sample_clues):
+    """
+    sample_clues as a cleaned clue table.
+
+    Built with clean_clue_table, so it has the same dictionary-encoded
+    columns as a real cache from build_clue_cache.
+    """
+    return clean_clue_table(pa.Table.from_pylist(sample_clues))
+
+
+@pytest.fixture
+def board_table():
+    """Two round-1 categories: FULL has every value, PARTIAL is missing $1000."""
+    rows = [
+        {"category": cat, "value": value, "question": "Q", "answer": "A", "round": "1"}
+        for cat in ("FULL", "PARTIAL")
+        for value in (200, 400, 600, 800, 1000)
+        if not (cat == "PARTIAL" and value == 1000)
+    ]
+    return clean_clue_table(pa.Table.from_pylist(rows))
+
+
+class TestClueCache:
+    """Tests for writing and memory-mapping the Arrow cache."""
+
+    def test_round_trip(self, tmp_path, clue_table):
+        """A written cache should read back as the same table."""
+        cache_path = tmp_path / "clues.arrow"
+
+        arrow_store.write_clue_cache(clue_table, cache_path)
+        loaded = arrow_store.open_clue_cache(cache_path)
+
+        assert loaded.equals(clue_table)
+
+    def test_build_from_tsv(self, tmp_path, temp_tsv_file):
+        """build_clue_cache should write the cleaned TSV clues."""
+        cache_path = tmp_path / "clues.arrow"
+
+        table = arrow_store.build_clue_cache(cache_path, temp_tsv_file)
+
+        assert cache_path.exists()
+        assert arrow_store.open_clue_cache(cache_path).num_rows == table.num_rows
+
+    def test_queries_on_built_cache(self, tmp_path, temp_tsv_file):
+        """Every query should run against the table build_clue_cache writes."""
+        cache_path = tmp_path / "clues.arrow"
+        arrow_store.build_clue_cache(cache_path, temp_tsv_file)
+        table = arrow_store.open_clue_cache(cache_path)
+
+        assert arrow_store.get_usable_categories(table) == []
+        clue = arrow_store.get_random_clue(table, "HISTORY", 400, round_num=1)
+        assert clue["answer"] == "George Washington"
+        clues = arrow_store.get_board_clues(
+            table, ["SCIENCE", "HISTORY"], [200, 400], round_num=1
+        )
+        assert set(clues) == {("SCIENCE", 200), ("HISTORY", 400)}
+
+
+class TestGetUsableCategories:
+    """Tests for finding complete categories."""
+
+    def test_only_complete_categories(self, board_table):
+        """Categories missing a value level should be excluded."""
+        assert arrow_store.get_usable_categories(board_table) == ["FULL"]
+
+    def test_min_clues_per_value(self, board_table):
+        """Requiring two clues per value should exclude everything here."""
+        usable = arrow_store.get_usable_categories(board_table, min_clues_per_value=2)
+        assert usable == []
+
+
+class TestGetRandomClue:
+    """Tests for random clue retrieval."""
+
+    def test_returns_matching_clue(self, clue_table):
+        """Should return a clue with the requested category and value."""
+        clue = arrow_store.get_random_clue(clue_table, "SCIENCE", 400)
+
+        assert clue is not None
+        assert clue["category"] == "SCIENCE"
+        assert clue["value"] == 400
+
+    def test_returns_none_for_missing(self, clue_table):
+        """Should return None if no matching clue exists."""
+        assert arrow_store.get_random_clue(clue_table, "NONEXISTENT", 200) is None
+
+
+class TestGetBoardClues:
+    """Tests for picking a whole board at once."""
+
+    def test_one_clue_per_cell(self, clue_table):
+        """Every cell with data gets one clue; empty cells are left out."""
+        clues = arrow_store.get_board_clues(
+            clue_table, ["SCIENCE", "HISTORY"], [200, 600]
+        )
+
+        assert set(clues) == {("SCIENCE", 200), ("SCIENCE", 600), ("HISTORY", 200)}
+        assert clues[("SCIENCE", 600)]["answer"] == "Gravity"
@@ -8,12 +8,72 @@ Run with: uv run pytest tests/jeopardy/test_data.py -v
 """
 
 import pytest
+import json
 from pathlib import Path
 
 # Import the module we're testing
 from jeopardy import data
 
 
+class TestLoadTsvData:
+    """Tests for loading the raw TSV clue file."""
+
+    def test_skips_malformed_rows(self, temp_tsv_file):
+        """Rows with a bad date or value should be dropped."""
+        clues = data.load_tsv_data(temp_tsv_file)
+        answers = [clue["answer"] for clue in clues]
+        assert answers == ["Mars", "George Washington", "Final", "Kept"]
+
+    def test_doubles_pre_2001_values(self, temp_tsv_file):
+        """Values from before Nov 2001 should be doubled."""
+        clues = data.load_tsv_data(temp_tsv_file)
+        assert clues[0]["value"] == 200
+        assert clues[1]["value"] == 400
+
+    def test_arrow_table_matches_python(self, temp_tsv_file):
+        """load_tsv_table should produce the same clues as load_tsv_data."""
+        pytest.importorskip("pyarrow")
+        table = data.load_tsv_table(temp_tsv_file)
+        assert table.to_pylist() == data.load_tsv_data(temp_tsv_file)
+
+    def test_uppercases_like_str_upper(self, temp_tsv_file):
+        """Categories should get str.upper()'s full case mapping ("ß" -> "SS")."""
+        pytest.importorskip("pyarrow")
+        categories = [clue["category"] for clue in data.load_tsv_data(temp_tsv_file)]
+        table = data.load_tsv_table(temp_tsv_file)
+
+        assert categories[-1] == "STRASSE"
+        assert table["category"].to_pylist() == categories
+
+    def test_clean_load_same_without_pyarrow(self, temp_tsv_file, monkeypatch):
+        """load_clean_tsv_data should keep the same rows with or without pyarrow."""
+        pytest.importorskip("pyarrow")
+        with_arrow = data.load_clean_tsv_data(temp_tsv_file)
+
+        def no_pyarrow(filepath):
+            raise ImportError("No module named 'pyarrow'")
+
+        monkeypatch.setattr(data, "load_tsv_table", no_pyarrow)
+
+        assert data.load_clean_tsv_data(temp_tsv_file) == with_arrow
+
+    def test_signed_values(self, tmp_path):
+        """Explicitly signed values like "+400" should load in both loaders."""
+        pytest.importorskip("pyarrow")
+        filepath = tmp_path / "signed.tsv"
+        filepath.write_text(
+            "round\tclue_value\tcategory\tanswer\tquestion\tair_date\n"
+            "1\t+400\tHISTORY\tFirst president\tWashington\t2010-01-04\n"
+            "1\t-200\tHISTORY\tSecond president\tAdams\t2010-01-04\n",
+            encoding="utf-8",
+        )
+
+        clues = data.load_tsv_data(filepath)
+
+        assert [clue["value"] for clue in clues] == [400, -200]
+        assert data.load_tsv_table(filepath).to_pylist() == clues
+
+
 class TestLoadSampleData:
     """Tests for loading the sample Jeopardy data."""
 
@@ -37,6 +97,45 @@ class TestLoadSampleData:
         assert len(clues) > 0, "Sample data should not be empty"
 
 
+class TestLoadJsonFile:
+    """Tests for loading clues from an arbitrary JSON file."""
+
+    def test_round_trips_clues(self, temp_json_file, sample_clues):
+        """Should return the same clues that were written."""
+        assert data.load_json_file(temp_json_file) == sample_clues
+
+    def test_missing_file_raises(self, tmp_path):
+        """Should raise FileNotFoundError for a missing file."""
+        with pytest.raises(FileNotFoundError):
+            data.load_json_file(tmp_path / "missing.json")
+
+
+class TestIterJsonlFile:
+    """Tests for streaming clues from a JSON Lines file."""
+
+    def test_yields_each_clue(self, tmp_path, sample_clues):
+        """Should yield one clue per non-blank line, in order."""
+        filepath = tmp_path / "clues.jsonl"
+        lines = [json.dumps(clue) for clue in sample_clues]
+        filepath.write_text("\n".join(lines) + "\n\n")
+
+        assert list(data.iter_jsonl_file(filepath)) == sample_clues
+
+
+class TestLoadParquetFile:
+    """Tests for loading clues from a Parquet file."""
+
+    def test_round_trips_clues(self, tmp_path, sample_clues):
+        """Should return the same clues that were written."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        filepath = tmp_path / "clues.parquet"
+        pq.write_table(pa.Table.from_pylist(sample_clues), filepath)
+
+        assert data.load_parquet_file(filepath) == sample_clues
+
+
 class TestValidateClue:
     """Tests for clue validation."""
 
@@ -110,6 +209,31 @@ class TestCleanClues:
         cleaned = data.clean_clues(sample_clues)
         assert isinstance(cleaned, list)
 
+    def test_accepts_any_iterable(self, sample_clues, invalid_clues):
+        """Tuples and generators should clean the same as a list."""
+        mixed = sample_clues + invalid_clues
+        expected = data.clean_clues(mixed)
+
+        assert data.clean_clues(tuple(mixed)) == expected
+        assert data.clean_clues(clue for clue in mixed) == expected
+
+    def test_arrow_table_matches_list(self, sample_clues, invalid_clues):
+        """A pyarrow Table should be cleaned exactly like the list version."""
+        pa = pytest.importorskip("pyarrow")
+        mixed = sample_clues + invalid_clues
+
+        cleaned = data.clean_clues(pa.Table.from_pylist(mixed))
+
+        assert cleaned == data.clean_clues(mixed)
+
+    def test_arrow_table_shares_category_strings(self, sample_clues):
+        """Repeated categories should come back as one shared str object."""
+        pa = pytest.importorskip("pyarrow")
+
+        cleaned = data.clean_clues(pa.Table.from_pylist(sample_clues))
+
+        assert cleaned[0]["category"] is cleaned[1]["category"]
+
 
 class TestGetCategories:
     """Tests for extracting unique categories."""
@@ -140,12 +264,13 @@ class TestGetCategories:
 class TestFilterByCategory:
     """Tests for filtering clues by category."""
 
-    def test_returns_matching_clues(self, sample_clues):
+    def test_returns_matching_clues(self, sample_clues, clues_by_category):
         """Should return only clues from the specified category."""
         science_clues = data.filter_by_category(sample_clues, "SCIENCE")
 
         for clue in science_clues:
             assert clue["category"] == "SCIENCE"
+        assert science_clues == clues_by_category["SCIENCE"]
 
     def test_nonexistent_category_returns_empty(self, sample_clues):
         """Should return empty list for category with no clues."""
@@ -161,3 +286,21 @@ class TestFilterByCategory:
             assert "question" in clue
             assert "answer" in clue
             assert "value" in clue
+
+
+class TestGroupByCategory:
+    """Tests for indexing clues by category."""
+
+    def test_groups_every_clue(self, sample_clues, clues_by_category):
+        """Every clue should land in exactly its own category's list."""
+        assert set(clues_by_category) == {"SCIENCE", "HISTORY"}
+        grouped = sum(len(group) for group in clues_by_category.values())
+        assert grouped == len(sample_clues)
+        for category, group in clues_by_category.items():
+            assert all(clue["category"] == category for clue in group)
+
+    def test_matches_filter_by_category(self, sample_clues, clues_by_category):
+        """Each group should equal filter_by_category for that category."""
+        for category in data.get_categories(sample_clues):
+            expected = data.filter_by_category(sample_clues, category)
+            assert clues_by_category[category] == expected
@@ -44,6 +44,17 @@ class TestCreateDatabase:
         database.create_database(temp_db)
         database.create_database(temp_db)  # Should not raise
 
+    def test_creates_lookup_index(self, temp_db):
+        """Should index the (category, value, round) lookup."""
+        database.create_database(temp_db)
+
+        conn = sqlite3.connect(temp_db)
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        names = [row[0] for row in rows]
+        conn.close()
+
+        assert "idx_clues_cvr" in names
+
 
 class TestLoadCluesToDb:
     """Tests for loading clues into database."""
@@ -85,33 +96,73 @@ class TestLoadCluesToDb:
 
         assert count == len(sample_clues)
 
+    def test_spans_multiple_batches(self, temp_db, sample_clues, monkeypatch):
+        """Clues split across several executemany batches should all land."""
+        monkeypatch.setattr(database, "INSERT_BATCH_SIZE", 2)
+        database.create_database(temp_db)
+
+        count = database.load_clues_to_db(sample_clues, temp_db)
+
+        assert count == len(sample_clues)
+        assert database.get_total_clue_count(temp_db) == len(sample_clues)
+
+    def test_accepts_generator(self, temp_db, sample_clues):
+        """A generator should load the same as a list, and be counted."""
+        database.create_database(temp_db)
+
+        count = database.load_clues_to_db((clue for clue in sample_clues), temp_db)
+
+        assert count == len(sample_clues)
+        assert database.get_total_clue_count(temp_db) == len(sample_clues)
+
+    def test_indexes_rebuilt_after_load(self, temp_db, sample_clues):
+        """Indexes dropped for the bulk load should be back afterwards."""
+        database.create_database(temp_db)
+        database.load_clues_to_db(sample_clues, temp_db)
+
+        conn = sqlite3.connect(temp_db)
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        names = {row[0] for row in rows}
+        conn.close()
+
+        assert set(database.INDEXES) <= names
+
+    def test_failed_load_rolls_back(self, populated_db, sample_clues):
+        """A bad clue should leave the previous contents untouched."""
+        bad_clues = sample_clues + [{"category": "BROKEN"}]
+
+        with pytest.raises(KeyError):
+            database.load_clues_to_db(bad_clues, populated_db)
+
+        assert database.get_total_clue_count(populated_db) == len(sample_clues)
+
 
 class TestGetRandomClue:
     """Tests for random clue retrieval."""
 
-    def test_returns_matching_category(self, populated_db, sample_clues):
+    def test_returns_matching_category(self, memory_db):
         """Should return clue from correct category."""
-        clue = database.get_random_clue("SCIENCE", 200, populated_db)
+        clue = database.get_random_clue("SCIENCE", 200, memory_db)
 
         assert clue is not None
         assert clue["category"] == "SCIENCE"
 
-    def test_returns_matching_value(self, populated_db, sample_clues):
+    def test_returns_matching_value(self, memory_db):
         """Should return clue with correct value."""
-        clue = database.get_random_clue("SCIENCE", 200, populated_db)
+        clue = database.get_random_clue("SCIENCE", 200, memory_db)
 
         assert clue is not None
         assert clue["value"] == 200
 
-    def test_returns_none_for_missing(self, populated_db):
+    def test_returns_none_for_missing(self, memory_db):
         """Should return None if no matching clue exists."""
-        clue = database.get_random_clue("NONEXISTENT", 200, populated_db)
+        clue = database.get_random_clue("NONEXISTENT", 200, memory_db)
 
         assert clue is None
 
-    def test_returns_dict_with_fields(self, populated_db):
+    def test_returns_dict_with_fields(self, memory_db):
         """Returned clue should have expected fields."""
-        clue = database.get_random_clue("SCIENCE", 200, populated_db)
+        clue = database.get_random_clue("SCIENCE", 200, memory_db)
 
         assert clue is not None
         assert "category" in clue
@@ -120,6 +171,121 @@ class TestGetRandomClue:
         assert "answer" in clue
 
 
+class TestGetFinalJeopardyClue:
+    """Tests for Final Jeopardy clue retrieval."""
+
+    def test_returns_round_3_clue(self, temp_db, sample_clues):
+        """Should only ever return Final Jeopardy clues."""
+        finals = [
+            {**clue, "round": "3", "category": f"FINAL {i}"}
+            for i, clue in enumerate(sample_clues[:2])
+        ]
+        database.create_database(temp_db)
+        database.load_clues_to_db(sample_clues + finals + sample_clues, temp_db)
+
+        for _ in range(10):
+            clue = database.get_final_jeopardy_clue(temp_db)
+            assert clue["round"] == "3"
+
+    def test_picks_uniformly_across_id_gaps(self, temp_db, sample_clues):
+        """A final right after a long run of other clues shouldn't be favored."""
+        first, second = (
+            {**clue, "round": "3", "category": f"FINAL {i}"}
+            for i, clue in enumerate(sample_clues[:2])
+        )
+        database.create_database(temp_db)
+        database.load_clues_to_db([first] + sample_clues * 20 + [second], temp_db)
+
+        picks = [
+            database.get_final_jeopardy_clue(temp_db)["category"] for _ in range(200)
+        ]
+
+        assert picks.count("FINAL 0") > 50
+        assert picks.count("FINAL 1") > 50
+
+    def test_returns_none_without_finals(self, memory_db):
+        """Should return None if there are no round-3 clues."""
+        assert database.get_final_jeopardy_clue(memory_db) is None
+
+
+class TestGetBoardClues:
+    """Tests for fetching a whole board in one query."""
+
+    def test_one_clue_per_cell(self, memory_db):
+        """Every (category, value) with data should get exactly one clue."""
+        clues = database.get_board_clues(["SCIENCE", "HISTORY"], [200, 400], memory_db)
+
+        assert set(clues) == {
+            ("SCIENCE", 200), ("SCIENCE", 400), ("HISTORY", 200), ("HISTORY", 400)
+        }
+        assert clues[("HISTORY", 200)]["answer"] == "George Washington"
+
+    def test_missing_cells_left_out(self, memory_db):
+        """Cells with no matching clue should not appear."""
+        clues = database.get_board_clues(
+            ["SCIENCE", "NONEXISTENT"], [600, 800], memory_db
+        )
+
+        assert set(clues) == {("SCIENCE", 600)}
+
+
+class TestGetUsableCategoriesCached:
+    """Tests for the sidecar-cached category scan."""
+
+    @staticmethod
+    def board_clues(category):
+        """One round-1 clue at every standard value."""
+        return [
+            {"category": category, "value": value, "question": "Q", "answer": "A",
+             "round": "1", "show_number": 1, "air_date": "2020-01-01"}
+            for value in (200, 400, 600, 800, 1000)
+        ]
+
+    def test_matches_uncached(self, temp_db):
+        """Should return the same categories and write the sidecar file."""
+        database.create_database(temp_db)
+        database.load_clues_to_db(self.board_clues("SCIENCE"), temp_db)
+
+        cached = database.get_usable_categories_cached(db_path=temp_db)
+
+        assert cached == database.get_usable_categories(db_path=temp_db) == ["SCIENCE"]
+        assert temp_db.with_suffix(".categories.json").exists()
+
+    def test_rebuilt_db_invalidates(self, temp_db):
+        """Reloading the database should not serve stale categories."""
+        database.create_database(temp_db)
+        database.load_clues_to_db(self.board_clues("SCIENCE"), temp_db)
+        database.get_usable_categories_cached(db_path=temp_db)
+
+        both = self.board_clues("SCIENCE") + self.board_clues("HISTORY")
+        database.load_clues_to_db(both, temp_db)
+
+        usable = database.get_usable_categories_cached(db_path=temp_db)
+        assert sorted(usable) == ["HISTORY", "SCIENCE"]
+
+    def test_min_clues_per_value(self, temp_db):
+        """A category needs that many clues at every value, not just one."""
+        database.create_database(temp_db)
+        science, history = self.board_clues("SCIENCE"), self.board_clues("HISTORY")
+        database.load_clues_to_db(science * 2 + history * 2 + history[:4], temp_db)
+
+        usable = database.get_usable_categories(2, temp_db)
+        assert sorted(usable) == ["HISTORY", "SCIENCE"]
+        assert database.get_usable_categories(3, temp_db) == []
+
+    def test_double_jeopardy_values(self, temp_db):
+        """Round 2 should look for the doubled values, not round 1's."""
+        doubled = [
+            {**clue, "round": "2", "value": clue["value"] * 2}
+            for clue in self.board_clues("SCIENCE")
+        ]
+        database.create_database(temp_db)
+        database.load_clues_to_db(self.board_clues("HISTORY") + doubled, temp_db)
+
+        usable = database.get_usable_categories(db_path=temp_db, round_num=2)
+        assert usable == ["SCIENCE"]
+
+
 class TestCountCluesByCategory:
     """Tests for counting clues by category."""
 
@@ -129,18 +295,11 @@ class TestCountCluesByCategory:
 
         assert isinstance(counts, dict)
 
-    def test_counts_correct(self, populated_db, sample_clues):
+    def test_counts_correct(self, populated_db, expected_category_counts):
         """Counts should match actual data."""
         counts = database.count_clues_by_category(populated_db)
 
-        # Count manually from sample_clues
-        expected = {}
-        for clue in sample_clues:
-            cat = clue["category"]
-            expected[cat] = expected.get(cat, 0) + 1
-
-        for cat, count in expected.items():
-            assert counts.get(cat) == count
+        assert counts == expected_category_counts
 
 
 class TestGetCategoryValueCounts:
@@ -165,11 +324,11 @@ class TestGetCategoryValueCounts:
 class TestGetTotalClueCount:
     """Tests for total clue count."""
 
-    def test_returns_correct_count(self, populated_db, sample_clues):
+    def test_returns_correct_count(self, populated_db, sample_clue_count):
         """Should return total number of clues."""
         count = database.get_total_clue_count(populated_db)
 
-        assert count == len(sample_clues)
+        assert count == sample_clue_count
 
     def test_empty_db_returns_zero(self, temp_db):
         """Empty database should return 0."""
@@ -178,3 +337,101 @@ class TestGetTotalClueCount:
         count = database.get_total_clue_count(temp_db)
 
         assert count == 0
+
+    def test_reload_invalidates_cached_count(self, temp_db, sample_clues):
+        """A memoized count should not survive changes to the database."""
+        database.create_database(temp_db)
+        assert database.get_total_clue_count(temp_db) == 0
+
+        database.load_clues_to_db(sample_clues, temp_db)
+
+        assert database.get_total_clue_count(temp_db) == len(sample_clues)
+
+
+class TestConnectionCache:
+    """Tests for the per-thread connection cache."""
+
+    def test_reuses_connection(self, temp_db):
+        """Queries on the same database should share one connection."""
+        assert database._connection(temp_db) is database._connection(temp_db)
+
+    def test_close_connections(self, temp_db):
+        """close_connections should force a fresh connection next time."""
+        first = database._connection(temp_db)
+
+        database.close_connections()
+
+        assert database._connection(temp_db) is not first
+
+    def test_read_only_connection(self, populated_db):
+        """Query connections should be read-only and separate from the writer."""
+        reader = database._connection(populated_db, read_only=True)
+
+        assert reader is not database._connection(populated_db)
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM clues")
+
+    def test_accepts_open_connection(self, populated_db):
+        """Query functions should use a connection passed in place of a path."""
+        conn = database.get_connection(
+            populated_db, read_only=True, check_same_thread=False
+        )
+
+        assert database._connection(conn) is conn
+        clue = database.get_random_clue("SCIENCE", 400, conn)
+        assert clue is not None
+        assert clue["category"] == "SCIENCE"
+        conn.close()
+
+
+class TestSearchClues:
+    """Tests for full-text clue search."""
+
+    def test_finds_answer_words(self, memory_db):
+        """Should match words in the answer, case-insensitively."""
+        results = database.search_clues("washington", memory_db)
+
+        assert [clue["answer"] for clue in results] == ["George Washington"]
+
+    def test_prefix_and_punctuation(self, memory_db):
+        """Partial words should match, and punctuation shouldn't break the query."""
+        assert database.search_clues("planet", memory_db)
+        assert database.search_clues("\"AT&T\" -", memory_db) == []
+
+    def test_respects_limit(self, memory_db):
+        """Should return at most limit clues."""
+        assert len(database.search_clues("a", memory_db, limit=1)) <= 1
+
+    def test_load_leaves_index_unbuilt(self, populated_db):
+        """Loading shouldn't pay for the index; the first search builds it."""
+        with sqlite3.connect(populated_db) as conn:
+            assert not database._has_search_index(conn)
+
+        assert database.search_clues("washington", populated_db)
+
+    def test_builds_missing_index_through_read_only_connection(self, populated_db):
+        """A read-only connection should still get the missing index built."""
+        conn = database.get_connection(populated_db, read_only=True)
+        try:
+            assert database.search_clues("washington", conn)
+        finally:
+            conn.close()
+
+    def test_append_updates_built_index(self, memory_db, sample_clues):
+        """Clues appended after the first search should be searchable."""
+        assert database.search_clues("zeppelin", memory_db) == []
+        clue = {**sample_clues[0], "answer": "Zeppelin"}
+        database.load_clues_to_db([clue], memory_db, clear_existing=False)
+
+        results = database.search_clues("zeppelin", memory_db)
+
+        assert [clue["answer"] for clue in results] == ["Zeppelin"]
+
+    def test_reload_replaces_built_index(self, memory_db, sample_clues):
+        """A reload should drop the old clues from search results."""
+        assert database.search_clues("washington", memory_db)
+        clue = {**sample_clues[0], "answer": "Zeppelin"}
+        database.load_clues_to_db([clue], memory_db)
+
+        assert database.search_clues("washington", memory_db) == []
+        assert database.search_clues("zeppelin", memory_db)
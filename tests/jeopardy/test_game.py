@@ -8,36 +8,73 @@ must be correct for the game to work!
 Run with: uv run pytest tests/jeopardy/test_game.py -v
 """
 
+import copy
+from functools import cache
+
 import pytest
 from jeopardy import game
 
 
-class TestNormalizeAnswer:
-    """Tests for answer normalization."""
-
-    def test_lowercase(self):
-        """Should convert to lowercase."""
-        assert game.normalize_answer("MARS") == "mars"
-        assert game.normalize_answer("Mars") == "mars"
+CATEGORIES = ["A", "B", "C", "D", "E", "F"]
+
+
+# Cached so every board reuses the same 30 clue dicts; tests only mark
+# slots answered, never change a clue
+@cache
+def mock_get_clue(cat, val):
+    return {"category": cat, "value": val, "question": "Q", "answer": "A"}
+
+
+@pytest.fixture
+def board():
+    """
+    A fresh standard board over CATEGORIES.
+
+    Built per test rather than deep-copied from a shared one: tests mark
+    clues answered, and generate_board is ~10x cheaper than deepcopy.
+    """
+    return game.generate_board(CATEGORIES, mock_get_clue)
+
+
+# (raw answer, normalized) - one test loops over these rather than a test
+# method (or a parametrize item) per case, so collection stays cheap
+NORMALIZE_CASES = [
+    ("MARS", "mars"),                            # Lowercased
+    ("Mars", "mars"),
+    ("  mars  ", "mars"),                        # Whitespace stripped
+    ("What is Mars", "mars"),                    # Question prefixes removed
+    ("Who is Einstein", "einstein"),
+    ("What are electrons", "electrons"),
+    ("Who are the Who?", "who"),                 # Every leading prefix goes...
+    ("what's   an apple", "apple"),
+    ("Theory", "theory"),                        # ...but not prefixes inside words
+]
+
+# (player answer, correct answer, should match)
+CHECK_ANSWER_CASES = [
+    ("Mars", "Mars", True),                      # Exact
+    ("mars", "Mars", True),                      # Case-insensitive
+    ("MARS", "mars", True),
+    ("What is Mars", "Mars", True),              # Question prefixes
+    ("what is mars", "Mars", True),
+    ("Who is Einstein", "Einstein", True),
+    ("  Mars  ", "Mars", True),                  # Extra whitespace
+    ("Jupiter", "Mars", False),                  # Wrong
+    ("What is Jupiter", "Mars", False),
+    ("", "Mars", False),                         # Empty
+    ("Shakespear", "Shakespeare", True),         # Near-miss spelling
+    ("Washington", "George Washington", True),   # Partial name
+    ("Venus", "Mars", False),
+]
 
-    def test_strips_whitespace(self):
-        """Should strip leading/trailing whitespace."""
-        assert game.normalize_answer("  mars  ") == "mars"
 
-    def test_strips_what_is(self):
-        """Should remove 'what is' prefix."""
-        result = game.normalize_answer("What is Mars")
-        assert result == "mars"
-
-    def test_strips_who_is(self):
-        """Should remove 'who is' prefix."""
-        result = game.normalize_answer("Who is Einstein")
-        assert result == "einstein"
+class TestNormalizeAnswer:
+    """Tests for answer normalization."""
 
-    def test_strips_what_are(self):
-        """Should remove 'what are' prefix."""
-        result = game.normalize_answer("What are electrons")
-        assert result == "electrons"
+    def test_normalize_cases(self):
+        """Each NORMALIZE_CASES input should normalize to its expected form."""
+        for raw, expected in NORMALIZE_CASES:
+            assert game.normalize_answer(raw) == expected, f"case {raw!r}"
 
     def test_strips_punctuation(self):
         """Should remove common punctuation."""
@@ -61,36 +98,42 @@ class TestNormalizeAnswer:
 class TestCheckAnswer:
     """Tests for answer checking."""
 
-    def test_exact_match(self):
-        """Exact answers should match."""
-        assert game.check_answer("Mars", "Mars") is True
+    def test_check_answer_cases(self):
+        """Each CHECK_ANSWER_CASES pair should match (or not) as listed."""
+        for player, correct, expected in CHECK_ANSWER_CASES:
+            result = game.check_answer(player, correct)
+            assert result is expected, f"case {player!r} vs {correct!r}"
 
-    def test_case_insensitive(self):
-        """Matching should be case-insensitive."""
-        assert game.check_answer("mars", "Mars") is True
-        assert game.check_answer("MARS", "mars") is True
 
-    def test_with_what_is_prefix(self):
-        """'What is X' should match 'X'."""
-        assert game.check_answer("What is Mars", "Mars") is True
-        assert game.check_answer("what is mars", "Mars") is True
+class TestCheckNormalizedAnswer:
+    """Tests for checking against a pre-normalized correct answer."""
 
-    def test_with_who_is_prefix(self):
-        """'Who is X' should match 'X'."""
-        assert game.check_answer("Who is Einstein", "Einstein") is True
+    def test_matches_check_answer(self):
+        """Should agree with check_answer once the correct answer is normalized."""
+        correct_norm = game.normalize_answer("George Washington")
 
-    def test_wrong_answer(self):
-        """Wrong answers should not match."""
-        assert game.check_answer("Jupiter", "Mars") is False
-        assert game.check_answer("What is Jupiter", "Mars") is False
+        for guess in ["Who is George Washington?", "Washington", "Lincoln", ""]:
+            expected = game.check_answer(guess, "George Washington")
+            assert game.check_normalized_answer(guess, correct_norm) == expected
 
-    def test_empty_answer(self):
-        """Empty player answer should not match."""
-        assert game.check_answer("", "Mars") is False
 
-    def test_whitespace_handling(self):
-        """Should handle extra whitespace."""
-        assert game.check_answer("  Mars  ", "Mars") is True
+class TestCheckAnswersBatch:
+    """Tests for grading many answers at once."""
+
+    def test_matches_check_answer(self):
+        """Each result should equal check_answer on the same pair."""
+        players = ["What is Mars?", "Shakespear", "Washington", "Venus", ""]
+        corrects = ["Mars", "Shakespeare", "George Washington", "Mars", "Mars"]
+
+        results = game.check_answers_batch(players, corrects)
+
+        assert results == [game.check_answer(p, c) for p, c in zip(players, corrects)]
+        assert results == [True, True, True, False, False]
+
+    def test_rejects_mismatched_lengths(self):
+        """Should raise ValueError if the lists don't pair up."""
+        with pytest.raises(ValueError):
+            game.check_answers_batch(["Mars"], [])
 
 
 class TestCalculateScoreChange:
@@ -115,81 +158,76 @@ class TestCalculateScoreChange:
 class TestGenerateBoard:
     """Tests for board generation."""
 
-    def test_has_six_categories(self):
+    def test_has_six_categories(self, board):
         """Board should have exactly 6 categories."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
+        assert {category for category, _ in board} == set(CATEGORIES)
 
-        board = game.generate_board(categories, mock_get_clue)
-        assert len(board) == 6
-
-    def test_each_category_has_five_values(self):
+    def test_each_category_has_five_values(self, board):
         """Each category should have 5 value levels."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
-        board = game.generate_board(categories, mock_get_clue)
-
-        for category in categories:
-            assert len(board[category]) == 5
+        assert len(board) == 30
+        for category in CATEGORIES:
             for value in game.STANDARD_VALUES:
-                assert value in board[category]
+                assert (category, value) in board
 
     def test_rejects_wrong_category_count(self):
         """Should raise ValueError if not given 6 categories."""
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
         with pytest.raises(ValueError):
             game.generate_board(["A", "B", "C"], mock_get_clue)  # Only 3
 
         with pytest.raises(ValueError):
             game.generate_board(["A", "B", "C", "D", "E", "F", "G"], mock_get_clue)  # 7
 
-    def test_slots_start_unanswered(self):
+    def test_slots_start_unanswered(self, board):
         """All slots should start as unanswered."""
+        for slot in board.values():
+            assert slot["answered"] is False
+
+
+class TestPickDailyDoubles:
+    """Tests for Daily Double placement."""
+
+    def test_picks_distinct_board_positions(self):
+        """Should return the requested number of distinct on-board positions."""
         categories = ["A", "B", "C", "D", "E", "F"]
 
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
+        for _ in range(50):
+            picks = game.pick_daily_doubles(categories, game.DOUBLE_JEOPARDY_VALUES, 2)
+            assert len(picks) == 2
+            for category, value in picks:
+                assert category in categories
+                assert value in game.DOUBLE_JEOPARDY_VALUES
 
-        board = game.generate_board(categories, mock_get_clue)
+    def test_every_position_reachable(self):
+        """Corners of the grid should be pickable."""
+        categories = ["A", "B", "C", "D", "E", "F"]
 
-        for category in board:
-            for value in board[category]:
-                assert board[category][value]["answered"] is False
+        seen = set()
+        for _ in range(2000):
+            seen |= game.pick_daily_doubles(categories, game.STANDARD_VALUES, 1)
+        assert ("A", 200) in seen
+        assert ("F", 1000) in seen
+        assert len(seen) == 30
 
 
 class TestIsBoardComplete:
     """Tests for checking if board is complete."""
 
-    def test_new_board_not_complete(self):
+    def test_new_board_not_complete(self, board):
         """Fresh board should not be complete."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
-        board = game.generate_board(categories, mock_get_clue)
         assert game.is_board_complete(board) is False
 
-    def test_fully_answered_board_complete(self):
+    def test_fully_answered_board_complete(self, board):
         """Board with all slots answered should be complete."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
+        # Mark all as answered
+        for cell in board:
+            board[cell]["answered"] = True
 
-        board = game.generate_board(categories, mock_get_clue)
+        assert game.is_board_complete(board) is True
 
-        # Mark all as answered
-        for category in board:
-            for value in board[category]:
-                board[category][value]["answered"] = True
+    def test_marked_board_complete(self, board):
+        """mark_clue_answered should complete the board the same way."""
+        for category, value in list(board):
+            game.mark_clue_answered(board, category, value)
 
         assert game.is_board_complete(board) is True
 
@@ -197,57 +235,100 @@ class TestIsBoardComplete:
 class TestGetRemainingClues:
     """Tests for getting remaining clues."""
 
-    def test_new_board_has_30_remaining(self):
+    def test_new_board_has_30_remaining(self, board):
         """Fresh board should have 30 remaining (6 categories * 5 values)."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
-        board = game.generate_board(categories, mock_get_clue)
         remaining = game.get_remaining_clues(board)
 
         assert len(remaining) == 30
 
-    def test_returns_tuples(self):
+    def test_returns_tuples(self, board):
         """Should return list of (category, value) tuples."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
-        board = game.generate_board(categories, mock_get_clue)
         remaining = game.get_remaining_clues(board)
 
         for item in remaining:
             assert isinstance(item, tuple)
             assert len(item) == 2
 
+    def test_skips_answered(self, board):
+        """Answered clues should drop out, leaving board order intact."""
+        game.mark_clue_answered(board, "A", 200)
+        game.mark_clue_answered(board, "F", 1000)
 
-class TestMarkClueAnswered:
-    """Tests for marking clues as answered."""
+        remaining = game.get_remaining_clues(board)
 
-    def test_marks_clue_answered(self):
-        """Should mark the specified clue as answered."""
-        categories = ["A", "B", "C", "D", "E", "F"]
+        assert remaining == list(board)[1:-1]
 
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
 
-        board = game.generate_board(categories, mock_get_clue)
+class TestMarkClueAnswered:
+    """Tests for marking clues as answered."""
 
-        assert board["A"][200]["answered"] is False
+    def test_marks_clue_answered(self, board):
+        """Should mark the specified clue as answered."""
+        assert board["A", 200]["answered"] is False
         game.mark_clue_answered(board, "A", 200)
-        assert board["A"][200]["answered"] is True
+        assert board["A", 200]["answered"] is True
 
-    def test_returns_false_for_invalid(self):
+    def test_returns_false_for_invalid(self, board):
         """Should return False for non-existent clue."""
-        categories = ["A", "B", "C", "D", "E", "F"]
-
-        def mock_get_clue(cat, val):
-            return {"category": cat, "value": val, "question": "Q", "answer": "A"}
-
-        board = game.generate_board(categories, mock_get_clue)
-
         result = game.mark_clue_answered(board, "INVALID", 200)
         assert result is False
+
+    def test_answered_clue_leaves_board(self, board):
+        """An answered clue should no longer be offered or counted."""
+        game.mark_clue_answered(board, "A", 200)
+        game.mark_clue_answered(board, "A", 200)  # Repeats don't count twice
+
+        assert game.get_clue_from_board(board, "A", 200) is None
+        assert game.get_clue_from_board(board, "A", 400)["value"] == 400
+        assert game.count_remaining(board) == 29
+
+    def test_flags_track_answered(self, board):
+        """board.flags should hold one byte per slot, in board order."""
+        game.mark_clue_answered(board, "B", 400)
+
+        assert len(board.flags) == 30
+        assert board.flags.count(1) == 1
+        assert board.flags[5 + 1] == 1  # Second category, second value
+
+    def test_direct_assignment_tracked(self, board):
+        """Setting a slot's answered flag directly should keep the counts right."""
+        board["A", 200]["answered"] = True
+        board["A", 200]["answered"] = True  # Repeats don't count twice
+        assert game.count_remaining(board) == 29
+        assert board.flags[0] == 1
+
+        board["A", 200]["answered"] = False
+        assert game.count_remaining(board) == 30
+        assert board.flags.count(1) == 0
+
+    def test_cells_fixed(self, board):
+        """Adding, replacing or removing a cell should raise TypeError."""
+        slot = {"clue": board["A", 200]["clue"], "answered": True}
+        changes = [
+            lambda: board.__setitem__(("A", 200), slot),
+            lambda: board.__setitem__(("Z", 200), slot),
+            lambda: board.__delitem__(("A", 200)),
+            lambda: board.pop(("A", 200)),
+            lambda: board.popitem(),
+            lambda: board.setdefault(("Z", 200), slot),
+            lambda: board.update({("Z", 200): slot}),
+            lambda: board.__ior__({("Z", 200): slot}),
+            lambda: board.clear(),
+        ]
+        for change in changes:
+            with pytest.raises(TypeError):
+                change()
+
+        assert len(board) == len(board.flags) == 30
+        assert game.count_remaining(board) == 30
+
+    def test_copy_keeps_tracking(self, board):
+        """A deep copy should be an independent, still-tracked Board."""
+        game.mark_clue_answered(board, "A", 200)
+        copied = copy.deepcopy(board)
+        copied["B", 400]["answered"] = True
+
+        assert isinstance(copied, game.Board)
+        assert game.count_remaining(copied) == 28
+        assert game.count_remaining(board) == 29
+        assert bytes(copied.flags) != bytes(board.flags)
@@ -10,7 +10,15 @@ import pytest
 import json
 from pathlib import Path
 
-from jeopardy.state import GameState, save_game, load_game, create_new_game
+from jeopardy.state import AnsweredSet, GameState, save_game, load_game, create_new_game
+
+
+@pytest.fixture
+def selected_state():
+    """A GameState with SCIENCE $400 selected and not yet answered."""
+    state = GameState(categories=["SCIENCE"])
+    state.select_clue("SCIENCE", 400, {"question": "Test", "answer": "Test"})
+    return state
 
 
 class TestGameState:
@@ -51,45 +59,29 @@ class TestGameState:
         with pytest.raises(ValueError):
             state.select_clue("SCIENCE", 400, clue)
 
-    def test_answer_clue_correct_adds_score(self):
+    def test_answer_clue_correct_adds_score(self, selected_state):
         """Correct answer should add to score."""
-        state = GameState(categories=["SCIENCE"])
-        clue = {"question": "Test", "answer": "Test"}
-        state.select_clue("SCIENCE", 400, clue)
-
-        state.answer_clue(correct=True, value=400)
+        selected_state.answer_clue(correct=True, value=400)
 
-        assert state.score == 400
+        assert selected_state.score == 400
 
-    def test_answer_clue_incorrect_subtracts_score(self):
+    def test_answer_clue_incorrect_subtracts_score(self, selected_state):
         """Incorrect answer should subtract from score."""
-        state = GameState(categories=["SCIENCE"])
-        clue = {"question": "Test", "answer": "Test"}
-        state.select_clue("SCIENCE", 400, clue)
+        selected_state.answer_clue(correct=False, value=400)
 
-        state.answer_clue(correct=False, value=400)
+        assert selected_state.score == -400
 
-        assert state.score == -400
-
-    def test_answer_clue_marks_answered(self):
+    def test_answer_clue_marks_answered(self, selected_state):
         """Answering should mark clue as answered."""
-        state = GameState(categories=["SCIENCE"])
-        clue = {"question": "Test", "answer": "Test", "category": "SCIENCE", "value": 400}
-        state.select_clue("SCIENCE", 400, clue)
+        selected_state.answer_clue(correct=True, value=400)
 
-        state.answer_clue(correct=True, value=400)
-
-        assert state.is_answered("SCIENCE", 400)
+        assert selected_state.is_answered("SCIENCE", 400)
 
-    def test_answer_clue_clears_current(self):
+    def test_answer_clue_clears_current(self, selected_state):
         """Answering should clear current_clue."""
-        state = GameState(categories=["SCIENCE"])
-        clue = {"question": "Test", "answer": "Test", "category": "SCIENCE", "value": 400}
-        state.select_clue("SCIENCE", 400, clue)
-
-        state.answer_clue(correct=True, value=400)
+        selected_state.answer_clue(correct=True, value=400)
 
-        assert state.current_clue is None
+        assert selected_state.current_clue is None
 
     def test_is_answered(self):
         """is_answered should return correct status."""
@@ -111,6 +103,12 @@ class TestGameState:
         state.answered.add(("A", 200))
         assert state.remaining_clues_count() == 29
 
+    def test_remaining_clues_count_without_categories(self):
+        """Answers with no categories on the board should never go negative."""
+        state = GameState(answered={("SCIENCE", 200), ("SCIENCE", 400)})
+
+        assert state.remaining_clues_count() == 0
+
     def test_get_available_values(self):
         """get_available_values should return unanswered values."""
         state = GameState(categories=["SCIENCE"])
@@ -126,62 +124,137 @@ class TestGameState:
         assert 200 in available
         assert 400 not in available
 
+    def test_remaining_per_category(self):
+        """Answering should decrement only that category's count."""
+        state = GameState(categories=["SCIENCE", "HISTORY"])
+        assert state.remaining_per_category == {"SCIENCE": 5, "HISTORY": 5}
+
+        state.select_clue("SCIENCE", 400, {"question": "Test", "answer": "Test"})
+        state.answer_clue(correct=True, value=400)
+        state.mark_answered("SCIENCE", 200)
+        state.mark_answered("SCIENCE", 200)  # Repeats don't count twice
+
+        assert state.remaining_per_category == {"SCIENCE": 3, "HISTORY": 5}
+
+    def test_answered_mask(self):
+        """Each category's answered values should be tracked as bits."""
+        state = GameState(categories=["SCIENCE", "HISTORY"])
+
+        state.mark_answered("SCIENCE", 200)
+        state.mark_answered("SCIENCE", 1000)
+
+        assert state.answered_mask == {"SCIENCE": 0b10001}
+        assert state.answered == {("SCIENCE", 200), ("SCIENCE", 1000)}
+
+    def test_plain_set_is_converted(self):
+        """Passing a regular set of tuples should still work."""
+        state = GameState(answered={("SCIENCE", 400)})
+
+        assert isinstance(state.answered, AnsweredSet)
+        assert state.is_answered("SCIENCE", 400)
+        assert len(state.answered) == 1
+
+    def test_non_board_value_rejected(self):
+        """Adding a value that isn't on any board should raise ValueError."""
+        state = GameState()
+
+        with pytest.raises(ValueError, match="300"):
+            state.answered.add(("SCIENCE", 300))
+        assert not state.answered
+
 
 class TestSaveLoadGame:
     """Tests for game persistence."""
 
-    def test_save_creates_file(self, tmp_path):
+    def test_save_creates_file(self, save_path):
         """save_game should create a JSON file."""
-        filepath = tmp_path / "save.json"
+        filepath = save_path
         state = GameState(score=500)
 
         save_game(state, filepath)
 
         assert filepath.exists()
 
-    def test_load_restores_score(self, tmp_path):
-        """load_game should restore the score."""
-        filepath = tmp_path / "save.json"
-        state = GameState(score=500)
+    def test_saves_answered_as_masks(self, save_path):
+        """Answered clues should be written as one bitmask per category."""
+        filepath = save_path
+        state = GameState()
+        state.answered.add(("SCIENCE", 200))
+        state.answered.add(("SCIENCE", 1000))
         save_game(state, filepath)
 
+        data = json.loads(filepath.read_text())
+
+        assert data["answered_mask"] == {"SCIENCE": 0b10001}
+
+    def test_load_old_answered_list(self, save_path):
+        """Saves from before answered_mask should still load."""
+        filepath = save_path
+        filepath.write_text(json.dumps({
+            "score": 200,
+            "answered": [["SCIENCE", 400], ["HISTORY", 200]],
+            "current_clue": None,
+            "categories": [],
+            "game_over": False,
+        }))
+
         loaded = load_game(filepath)
 
-        assert loaded.score == 500
+        assert loaded.answered == {("SCIENCE", 400), ("HISTORY", 200)}
 
-    def test_load_restores_answered(self, tmp_path):
-        """load_game should restore answered clues."""
-        filepath = tmp_path / "save.json"
-        state = GameState()
-        state.answered.add(("SCIENCE", 400))
-        state.answered.add(("HISTORY", 200))
-        save_game(state, filepath)
+    def test_load_old_list_skips_non_board_values(self, save_path):
+        """Old answered pairs that aren't board values should be dropped."""
+        filepath = save_path
+        filepath.write_text(json.dumps({
+            "score": 0,
+            "answered": [["SCIENCE", 300], ["HISTORY", 200]],
+            "current_clue": None,
+            "categories": [],
+            "game_over": False,
+        }))
 
         loaded = load_game(filepath)
 
-        assert ("SCIENCE", 400) in loaded.answered
-        assert ("HISTORY", 200) in loaded.answered
+        assert loaded.answered == {("HISTORY", 200)}
 
-    def test_load_restores_categories(self, tmp_path):
-        """load_game should restore categories."""
-        filepath = tmp_path / "save.json"
-        state = GameState(categories=["A", "B", "C", "D", "E", "F"])
+    def test_gz_save_is_compressed(self, save_path):
+        """Saving to a .gz name should gzip the file and load it back."""
+        filepath = save_path.with_suffix(".json.gz")
+        state = GameState(score=500, categories=["A", "B", "C", "D", "E", "F"])
+        state.answered.add(("A", 200))
         save_game(state, filepath)
 
+        assert filepath.read_bytes()[:2] == b"\x1f\x8b"
         loaded = load_game(filepath)
+        assert loaded.score == 500
+        assert loaded.answered == {("A", 200)}
+
+    def test_serializes_once(self, save_path, monkeypatch):
+        """save_game should convert the state to a dict exactly once."""
+        from jeopardy import state as state_module
+
+        calls = []
+        original = state_module.state_to_dict
+
+        def counting_state_to_dict(state):
+            calls.append(state)
+            return original(state)
+
+        monkeypatch.setattr(state_module, "state_to_dict", counting_state_to_dict)
+        save_game(GameState(score=500), save_path)
 
-        assert loaded.categories == ["A", "B", "C", "D", "E", "F"]
+        assert len(calls) == 1
 
-    def test_load_nonexistent_raises(self, tmp_path):
+    def test_load_nonexistent_raises(self, save_path):
         """load_game should raise FileNotFoundError for missing file."""
-        filepath = tmp_path / "nonexistent.json"
+        filepath = save_path  # Never written
 
         with pytest.raises(FileNotFoundError):
             load_game(filepath)
 
-    def test_round_trip(self, tmp_path):
+    def test_round_trip(self, save_path):
         """Save then load should preserve all state."""
-        filepath = tmp_path / "save.json"
+        filepath = save_path
 
         original = GameState(
             score=1200,
@@ -198,6 +271,8 @@ class TestSaveLoadGame:
         assert loaded.answered == original.answered
         assert loaded.categories == original.categories
         assert loaded.game_over == original.game_over
+        assert ("A", 200) in loaded.answered
+        assert loaded.remaining_per_category["A"] == 4
 
 
 class TestCreateNewGame: